@@ -101,6 +101,8 @@ class Config:
     fulltext_top_n: int = 5           # Deprecated, kept for compatibility
     pdf_max_pages: int = 10           # Maximum pages to extract from PDF (0 = all pages, default: 10)
                                       # Only first N pages are sent to LLM to save tokens
+    pdf_cache_dir: str = ".cache/pdfs"  # Raw PDF download cache keyed by URL hash ("" = off)
+    pdf_cache_ttl_days: int = 7         # Re-download cached PDFs older than this
     
     # Source enablement settings
     papers_enabled: bool = True            # Enable fetching from paper sources (arXiv, HF, Manual)
@@ -114,6 +116,7 @@ class Config:
     semantic_memory_path: str = "semantic_scholar_memory.json"
     semantic_seen_ttl_days: int = 30
     semantic_memory_max_ids: int = 5000
+    http_cache_dir: str = ".cache/http"    # ETag/Last-Modified cache for arXiv/HF responses ("" = off)
     
     # =============================================================================
     # Blog Source Settings (NEW!)
@@ -193,6 +196,9 @@ class Config:
             "semantic_memory_path": os.getenv("SEMANTIC_MEMORY_PATH"),
             "semantic_seen_ttl_days": os.getenv("SEMANTIC_SEEN_TTL_DAYS"),
             "semantic_memory_max_ids": os.getenv("SEMANTIC_MEMORY_MAX_IDS"),
+            "http_cache_dir": os.getenv("HTTP_CACHE_DIR"),
+            "pdf_cache_dir": os.getenv("PDF_CACHE_DIR"),
+            "pdf_cache_ttl_days": os.getenv("PDF_CACHE_TTL_DAYS"),
             # Blog settings from environment
             "blogs_enabled": os.getenv("BLOGS_ENABLED"),
             "blog_days_back": os.getenv("BLOG_DAYS_BACK"),
@@ -217,6 +223,7 @@ class Config:
                     "semantic_scholar_max_results",
                     "semantic_seen_ttl_days",
                     "semantic_memory_max_ids",
+                    "pdf_cache_ttl_days",
                     "feedback_token_ttl_days",
                     "feedback_resolution_timeout_sec",
                     "feedback_resolution_max_lookups",
@@ -264,6 +271,8 @@ class Config:
             "extract_fulltext": self.extract_fulltext,
             "fulltext_top_n": self.fulltext_top_n,
             "pdf_max_pages": getattr(self, 'pdf_max_pages', 10),
+            "pdf_cache_dir": self.pdf_cache_dir,
+            "pdf_cache_ttl_days": self.pdf_cache_ttl_days,
             "papers_enabled": self.papers_enabled,
             "manual_source_enabled": self.manual_source_enabled,
             "manual_source_path": self.manual_source_path,
@@ -274,6 +283,7 @@ class Config:
             "semantic_memory_path": self.semantic_memory_path,
             "semantic_seen_ttl_days": self.semantic_seen_ttl_days,
             "semantic_memory_max_ids": self.semantic_memory_max_ids,
+            "http_cache_dir": self.http_cache_dir,
             # Blog settings
             "blogs_enabled": self.blogs_enabled,
             "blog_days_back": self.blog_days_back,
@@ -58,12 +58,14 @@ class LLMFilter:
         base_url: str = "https://api.openai.com/v1",
         model: str = "gpt-4o-mini",
         batch_size: int = 10,
+        max_concurrent_batches: int = 4,
     ):
         self.api_key = api_key
         self.research_interests = research_interests
         self.base_url = base_url
         self.model = model
         self.batch_size = batch_size
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
         self.debug_dir = Path(os.getenv("LLM_FILTER_DEBUG_DIR", "llm_filter_debug"))
 
     async def filter(
@@ -88,26 +90,32 @@ class LLMFilter:
 
         client = LLMClient(api_key=self.api_key, base_url=self.base_url, model=self.model)
 
-        all_scored_papers: List[Paper] = []
         total_batches = (len(papers) + self.batch_size - 1) // self.batch_size
 
         stage_name = "Fine (with community signals)" if include_community_signals else "Coarse (title+abstract)"
         print(f"   📊 LLM Filter [{stage_name}]: Processing {len(papers)} papers in {total_batches} batches")
 
-        for batch_idx, batch_start in enumerate(range(0, len(papers), self.batch_size)):
+        # Batches are independent requests; run a bounded number at once to stay under rate limits.
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+
+        async def run_batch(batch_idx: int, batch_start: int) -> List[Paper]:
             batch_papers = papers[batch_start : batch_start + self.batch_size]
-            print(f"   🔄 Batch {batch_idx + 1}/{total_batches} ({len(batch_papers)} papers)...")
-            
-            batch_results = await self._filter_batch(
-                client, 
-                batch_papers, 
-                batch_start,
-                include_community_signals=include_community_signals
+            async with semaphore:
+                print(f"   🔄 Batch {batch_idx + 1}/{total_batches} ({len(batch_papers)} papers)...")
+                return await self._filter_batch(
+                    client,
+                    batch_papers,
+                    batch_start,
+                    include_community_signals=include_community_signals
+                )
+
+        try:
+            batch_results = await asyncio.gather(
+                *(run_batch(batch_idx, batch_start) for batch_idx, batch_start in enumerate(range(0, len(papers), self.batch_size)))
             )
-            all_scored_papers.extend(batch_results)
-            
-            if batch_idx < total_batches - 1:
-                await asyncio.sleep(0.5)
+        finally:
+            await client.aclose()
+        all_scored_papers: List[Paper] = [paper for batch in batch_results for paper in batch]
 
         print(f"   ✅ Scored {len(all_scored_papers)} papers, sorting by relevance...")
         all_scored_papers.sort(key=lambda p: getattr(p, "relevance_score", 0), reverse=True)
@@ -127,13 +135,14 @@ class LLMFilter:
             include_community_signals: If True, includes research_notes in the prompt
         """
         # Build paper text for LLM
-        papers_text = ""
+        paper_blocks: List[str] = []
         for i, paper in enumerate(papers):
+            authors = getattr(paper, "authors", [])
             authors_str = ", ".join(
-                [f"{a.name}" + (f" ({a.affiliation})" if getattr(a, "affiliation", None) else "") 
-                 for a in getattr(paper, "authors", [])[:5]]
+                a.name + (f" ({a.affiliation})" if getattr(a, "affiliation", None) else "")
+                for a in authors[:5]
             )
-            if len(getattr(paper, "authors", [])) > 5:
+            if len(authors) > 5:
                 authors_str += " et al."
             
             categories = ", ".join(getattr(paper, "categories", [])[:3]) if getattr(paper, "categories", None) else "N/A"
@@ -149,7 +158,8 @@ Categories: {categories}"""
             if include_community_signals and hasattr(paper, 'research_notes') and paper.research_notes:
                 paper_block += f"\n🔍 Community Signals: {paper.research_notes}"
             
-            papers_text += paper_block + "\n---\n"
+            paper_blocks.append(paper_block + "\n---\n")
+        papers_text = "".join(paper_blocks)
 
         # Build prompt based on stage
         if include_community_signals:
@@ -5,13 +5,27 @@ Works with: OpenAI, Claude, Gemini, DeepSeek, Qwen, local models, etc.
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
+import io
+import json
+import os
+import time
 import httpx
-import aiohttp
 from openai import OpenAI, AsyncOpenAI
 from typing import Optional, Union, List
 from pathlib import Path
 
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Expired PDFs are kept for revalidation until they are this many TTLs old, then deleted.
+_PDF_CACHE_PRUNE_TTLS = 4
+
 
 class LLMClient:
     """
@@ -65,12 +79,22 @@ class LLMClient:
         debug_save_pdfs: bool = False,  # 是否保存PDF到本地用于调试
         debug_pdf_dir: str = "debug_pdfs",  # PDF保存目录
         pdf_max_pages: int = 10,  # PDF最大页数（0表示不限制）
+        pdf_cache_dir: Optional[str] = None,  # 原始PDF磁盘缓存目录（None表示不缓存）
+        pdf_cache_ttl_days: int = 7,
+        max_concurrent_pdfs: int = 4,  # 同时下载的PDF数量上限（避免被arXiv限流）
     ):
         self.model = model
         self.base_url = base_url
         self.debug_save_pdfs = debug_save_pdfs
         self.debug_pdf_dir = debug_pdf_dir
         self.pdf_max_pages = pdf_max_pages
+        self.pdf_cache_dir = pdf_cache_dir
+        self.pdf_cache_ttl_days = pdf_cache_ttl_days
+        self._prune_pdf_cache()
+        # Shared pool for PDF downloads, created lazily inside the running loop
+        self._http: Optional[httpx.AsyncClient] = None
+        # Counts logical downloads; the connector's limit_per_host counts sockets.
+        self._pdf_semaphore = asyncio.Semaphore(max(1, max_concurrent_pdfs))
         
         # 检测是否是 Anthropic API（需要特殊处理）
         self.is_anthropic = "anthropic.com" in base_url
@@ -104,7 +128,7 @@ class LLMClient:
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=max_tokens,
-                messages=messages,
+                **self._anthropic_message_kwargs(messages),
             )
             return response.content[0].text
         else:
@@ -127,7 +151,7 @@ class LLMClient:
             response = await self.async_client.messages.create(
                 model=self.model,
                 max_tokens=max_tokens,
-                messages=messages,
+                **self._anthropic_message_kwargs(messages),
             )
             return response.content[0].text
         else:
@@ -215,8 +239,8 @@ class LLMClient:
             return await self.achat(messages, max_tokens=max_tokens)
         
         else:
-            # Fallback: extract text and send as text
-            text = self._extract_pdf_text_from_base64(pdf_data)
+            # Fallback: extract text and send as text (PyMuPDF is CPU-bound; keep it off the loop)
+            text = await asyncio.to_thread(self._extract_pdf_text_from_base64, pdf_data)
             messages = [{
                 "role": "user", 
                 "content": f"{prompt}\n\n---\nPaper content:\n{text[:30000]}"
@@ -299,6 +323,55 @@ class LLMClient:
             # This is a simplified fallback - you might want to implement batch processing
             raise NotImplementedError("Multiple PDFs not yet supported for this model. Use achat_with_pdf for single PDFs.")
     
+    async def _get_http(self) -> httpx.AsyncClient:
+        """Return the pooled client used for PDF downloads.
+        
+        With HTTP/2 (needs the h2 package) concurrent arXiv downloads share one
+        multiplexed connection instead of one TLS handshake each.
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+                timeout=httpx.Timeout(60.0),
+                follow_redirects=True,
+            )
+        return self._http
+    
+    async def aclose(self) -> None:
+        """Close the PDF download session and the async API client."""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+        await self.async_client.close()
+    
+    def supports_prompt_cache(self) -> bool:
+        """Check if the backend honours explicit cache_control breakpoints (Anthropic)."""
+        return self.is_anthropic
+    
+    def _anthropic_message_kwargs(self, messages: list[dict]) -> dict:
+        """
+        Anthropic takes the system prompt as a top-level parameter, not a message.
+        The last system block is marked cacheable so repeated runs reuse the prefix.
+        """
+        system_blocks = []
+        chat_messages = []
+        for message in messages:
+            if message.get("role") != "system":
+                chat_messages.append(message)
+                continue
+            content = message["content"]
+            if isinstance(content, str):
+                system_blocks.append({"type": "text", "text": content})
+            else:
+                system_blocks.extend(content)
+        
+        kwargs = {"messages": chat_messages}
+        if system_blocks:
+            system_blocks[-1] = {**system_blocks[-1], "cache_control": {"type": "ephemeral"}}
+            kwargs["system"] = system_blocks
+        return kwargs
+    
     def supports_pdf_native(self) -> bool:
         """Check if this model supports native PDF input."""
         model_lower = self.model.lower()
@@ -409,64 +482,188 @@ class LLMClient:
             max_pages: Maximum number of pages to extract (default: 10, set to 0 for all pages)
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=60)) as response:
-                    if response.status != 200:
-                        print(f"      ⚠️ PDF download failed: HTTP {response.status}")
-                        return None
-                    content = await response.read()
-                    
-                    # 简单检查是否是PDF
-                    if not content.startswith(b'%PDF'):
-                        print(f"      ⚠️ Downloaded content is not a valid PDF (doesn't start with %PDF)")
-                        return None
-                    
-                    # 如果指定了最大页数，提取前N页
-                    if max_pages > 0:
-                        try:
-                            import fitz  # PyMuPDF
-                            doc = fitz.open(stream=content, filetype="pdf")
-                            total_pages = len(doc)
-                            
-                            if total_pages > max_pages:
-                                # 创建新PDF，只包含前N页
-                                new_doc = fitz.open()
-                                new_doc.insert_pdf(doc, from_page=0, to_page=max_pages - 1)
-                                # 将新PDF保存到内存
-                                content = new_doc.tobytes()
-                                new_doc.close()
-                                print(f"      📄 Extracted first {max_pages} pages (total: {total_pages} pages)")
-                            else:
-                                print(f"      📄 PDF has {total_pages} pages (≤ {max_pages}, using all)")
-                            
-                            doc.close()
-                        except ImportError:
-                            print(f"      ⚠️ PyMuPDF not available, using full PDF")
-                        except Exception as e:
-                            print(f"      ⚠️ Failed to extract pages: {e}, using full PDF")
-                    
-                    # 调试：保存PDF到本地（如果启用）
-                    if save_debug:
-                        import os
-                        from pathlib import Path
-                        os.makedirs(debug_dir, exist_ok=True)
-                        # 从URL提取文件名
-                        filename = url.split('/')[-1].split('?')[0] or "paper.pdf"
-                        if not filename.endswith('.pdf'):
-                            filename += '.pdf'
-                        filepath = Path(debug_dir) / filename
-                        with open(filepath, 'wb') as f:
-                            f.write(content)
-                        print(f"      💾 Debug: PDF saved to {filepath} ({len(content)} bytes)")
-                    
-                    pdf_base64 = base64.standard_b64encode(content).decode("utf-8")
-                    print(f"      ✓ PDF processed: {len(content)} bytes -> base64 length: {len(pdf_base64)}")
-                    return pdf_base64
+            content, fresh = self._read_pdf_cache(url)
+            if fresh:
+                print(f"      ♻️ PDF cache hit ({len(content)} bytes)")
+            else:
+                # A stale copy is revalidated with a conditional GET instead of re-downloaded.
+                content = await self._download_pdf(url, stale=content)
+                if content is None:
+                    return None
+            
+            # 如果指定了最大页数，提取前N页（在线程中执行，避免阻塞事件循环）
+            if max_pages > 0:
+                content = await asyncio.to_thread(self._trim_pdf_pages, content, max_pages)
+            
+            # 调试：保存PDF到本地（如果启用）
+            if save_debug:
+                os.makedirs(debug_dir, exist_ok=True)
+                # 从URL提取文件名
+                filename = url.split('/')[-1].split('?')[0] or "paper.pdf"
+                if not filename.endswith('.pdf'):
+                    filename += '.pdf'
+                filepath = Path(debug_dir) / filename
+                with open(filepath, 'wb') as f:
+                    f.write(content)
+                print(f"      💾 Debug: PDF saved to {filepath} ({len(content)} bytes)")
+            
+            pdf_base64 = base64.standard_b64encode(content).decode("ascii")
+            print(f"      ✓ PDF processed: {len(content)} bytes -> base64 length: {len(pdf_base64)}")
+            return pdf_base64
         except Exception as e:
             url_preview = str(url)[:50] if url is not None else "<none>"
             print(f"      ⚠️ PDF download failed for {url_preview}...: {e}")
             return None
     
+    def _trim_pdf_pages(self, content, max_pages: int):
+        """Keep only the first max_pages pages; returns content unchanged on failure."""
+        try:
+            import fitz  # PyMuPDF
+            doc = fitz.open(stream=content, filetype="pdf")
+            total_pages = len(doc)
+            
+            if total_pages > max_pages:
+                # 创建新PDF，只包含前N页
+                new_doc = fitz.open()
+                new_doc.insert_pdf(doc, from_page=0, to_page=max_pages - 1)
+                # 将新PDF保存到内存
+                content = new_doc.tobytes()
+                new_doc.close()
+                print(f"      📄 Extracted first {max_pages} pages (total: {total_pages} pages)")
+            else:
+                print(f"      📄 PDF has {total_pages} pages (≤ {max_pages}, using all)")
+            
+            doc.close()
+        except ImportError:
+            print(f"      ⚠️ PyMuPDF not available, using full PDF")
+        except Exception as e:
+            print(f"      ⚠️ Failed to extract pages: {e}, using full PDF")
+        return content
+    
+    async def _download_pdf(self, url: str, stale: Optional[bytes] = None) -> Optional[bytes]:
+        """Fetch raw PDF bytes, falling back to the stale cached copy if the refresh fails."""
+        try:
+            content = await self._fetch_pdf(url, stale)
+        except httpx.HTTPError as e:
+            if stale is None:
+                raise
+            print(f"      ⚠️ PDF revalidation failed: {type(e).__name__}: {e}")
+            content = None
+        if content is None and stale is not None:
+            print(f"      ♻️ Using stale cached PDF ({len(stale)} bytes)")
+            return stale
+        return content
+    
+    async def _fetch_pdf(self, url: str, stale: Optional[bytes] = None) -> Optional[bytes]:
+        """Fetch raw PDF bytes (updating the disk cache); None on HTTP errors or non-PDF bodies."""
+        headers = self._pdf_cache_validators(url) if stale is not None else {}
+        client = await self._get_http()
+        async with self._pdf_semaphore, client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304 and stale is not None:
+                print(f"      ♻️ PDF not modified, reusing cached copy ({len(stale)} bytes)")
+                self._touch_pdf_cache(url)
+                return stale
+            if response.status_code != 200:
+                print(f"      ⚠️ PDF download failed: HTTP {response.status_code}")
+                return None
+            # Stream into one growable buffer and hand out a view of it, rather than
+            # joining chunks into a fresh bytes object.
+            buffer = io.BytesIO()
+            async for chunk in response.aiter_bytes(65536):
+                buffer.write(chunk)
+            content = buffer.getbuffer()
+            validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        
+        # 简单检查是否是PDF
+        if content[:4] != b'%PDF':
+            print(f"      ⚠️ Downloaded content is not a valid PDF (doesn't start with %PDF)")
+            return None
+        self._write_pdf_cache(url, content, validators)
+        return content
+    
+    def _pdf_cache_path(self, url: str, suffix: str = ".pdf") -> Optional[Path]:
+        if not self.pdf_cache_dir:
+            return None
+        return Path(self.pdf_cache_dir) / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}{suffix}"
+    
+    def _prune_pdf_cache(self) -> None:
+        """Delete cache entries (PDF, sidecar, leftover temp files) past the retention bound."""
+        if not self.pdf_cache_dir:
+            return
+        cutoff = time.time() - self.pdf_cache_ttl_days * _PDF_CACHE_PRUNE_TTLS * 86400
+        removed = 0
+        try:
+            entries = list(Path(self.pdf_cache_dir).iterdir())
+        except OSError:
+            return
+        for path in entries:
+            # A sidecar lives as long as its PDF, whose mtime is refreshed on revalidation.
+            key = path.name.split(".", 1)[0]
+            pdf_path = path.with_name(f"{key}.pdf")
+            try:
+                try:
+                    mtime = pdf_path.stat().st_mtime
+                except FileNotFoundError:
+                    mtime = path.stat().st_mtime
+                if mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        if removed:
+            print(f"   🧹 Pruned {removed} expired PDF cache files")
+    
+    def _read_pdf_cache(self, url: str) -> tuple[Optional[bytes], bool]:
+        """Return (cached raw PDF or None, whether it is younger than the TTL)."""
+        path = self._pdf_cache_path(url)
+        if path is None:
+            return None, False
+        try:
+            fresh = time.time() - path.stat().st_mtime <= self.pdf_cache_ttl_days * 86400
+            return path.read_bytes(), fresh
+        except OSError:
+            return None, False
+    
+    def _pdf_cache_validators(self, url: str) -> dict:
+        """If-None-Match / If-Modified-Since headers from the cached response's sidecar."""
+        meta_path = self._pdf_cache_path(url, ".meta.json")
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (AttributeError, OSError, ValueError):
+            return {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+    
+    def _touch_pdf_cache(self, url: str) -> None:
+        """Restart the TTL of a revalidated cache entry."""
+        try:
+            os.utime(self._pdf_cache_path(url))
+        except (OSError, TypeError):
+            pass
+    
+    def _write_pdf_cache(self, url: str, content: bytes, validators: dict) -> None:
+        path = self._pdf_cache_path(url)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            for target, data in (
+                (path, content),
+                (self._pdf_cache_path(url, ".meta.json"), json.dumps({"url": url, **validators}).encode("utf-8")),
+            ):
+                tmp_path = target.with_suffix(target.suffix + ".tmp")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, target)
+        except OSError as e:
+            print(f"      ⚠️ PDF cache write failed: {e}")
+    
     def _extract_pdf_text_from_base64(self, pdf_base64: str) -> str:
         """Extract text from base64-encoded PDF."""
         try:
@@ -11,21 +11,33 @@ from __future__ import annotations
 import asyncio
 import argparse
 import base64
+import logging
 import os
 import re
+import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 from urllib.parse import urlsplit, urlunsplit
 
-from sources import ArxivSource, HuggingFaceSource, ManualSource, SemanticScholarSource, BlogSource
+from sources import (
+    ArxivSource,
+    BlogSource,
+    HttpCache,
+    HuggingFaceSource,
+    ManualSource,
+    SemanticScholarSource,
+    close_session,
+    fetch_all,
+)
 from sources.blog_sources import fetch_blog_posts
 from filters import KeywordFilter, LLMFilter
 from researcher import PaperResearcher, MockPaperResearcher
 from summarizer import PaperSummarizer
 from emailer import ResendEmailer, FileEmailer
 from config import Config
-from models import Paper, PaperSource
+from models import Paper, PaperSource, dedupe_papers
 from semantic_memory import SemanticMemoryStore, memory_keys_for_paper
 from semantic_feedback import (
     build_feedback_run_view_url,
@@ -67,12 +79,12 @@ async def fetch_papers(config: Config, days_back: int = 1) -> List[Paper]:
             return candidates
         try:
             ttl_days = getattr(config, "semantic_seen_ttl_days", 30)
-            filtered: List[Paper] = []
-            for paper in candidates:
-                keys = memory_keys_for_paper(paper)
-                if keys and memory_store.recently_seen_any(keys, ttl_days=ttl_days):
-                    continue
-                filtered.append(paper)
+            keyed = [(paper, memory_keys_for_paper(paper)) for paper in candidates]
+            seen_keys = memory_store.filter_recently_seen(
+                {key for _paper, keys in keyed for key in keys},
+                ttl_days=ttl_days,
+            )
+            filtered = [paper for paper, keys in keyed if keys.isdisjoint(seen_keys)]
             suppressed = len(candidates) - len(filtered)
             if suppressed:
                 print(
@@ -84,31 +96,33 @@ async def fetch_papers(config: Config, days_back: int = 1) -> List[Paper]:
             print(f"      ⚠️ {source_label} suppression failed, proceeding without suppression: {e}")
             return candidates
     
+    http_cache_dir = getattr(config, "http_cache_dir", "")
+    http_cache = HttpCache(http_cache_dir) if http_cache_dir else None
+
+    # Sources are independent, so fetch them concurrently and report in order.
+    fetches = {}
+
     # arXiv
     print("📚 Fetching from arXiv...")
-    arxiv_source = ArxivSource(config.arxiv_categories)
-    arxiv_papers = await arxiv_source.fetch(days_back=days_back, max_results=300)
-    arxiv_papers = suppress_by_memory(arxiv_papers, "arXiv")
-    papers.extend(arxiv_papers)
-    print(f"   Found {len(arxiv_papers)} papers")
-    
+    arxiv_source = ArxivSource(config.arxiv_categories, http_cache=http_cache)
+    arxiv_seen_ids = None
+    if memory_store:
+        arxiv_seen_ids = memory_store.seen_arxiv_ids(getattr(config, "semantic_seen_ttl_days", 30))
+    fetches["arxiv"] = arxiv_source.fetch(days_back=days_back, max_results=300, seen_ids=arxiv_seen_ids)
+
     # Hugging Face Daily Papers
     print("🤗 Fetching from HuggingFace Daily Papers...")
-    hf_source = HuggingFaceSource()
-    hf_papers = await hf_source.fetch()
-    hf_papers = suppress_by_memory(hf_papers, "HuggingFace")
-    papers.extend(hf_papers)
-    print(f"   Found {len(hf_papers)} papers")
-    
+    hf_source = HuggingFaceSource(http_cache=http_cache)
+    fetches["hf"] = hf_source.fetch()
+
     # Manual additions (from D1 or local)
     if config.manual_source_enabled:
         print("📝 Fetching manual additions...")
         manual_source = ManualSource(config.manual_source_path)
-        manual_papers = await manual_source.fetch()
-        papers.extend(manual_papers)
-        print(f"   Found {len(manual_papers)} papers")
+        fetches["manual"] = manual_source.fetch()
 
     # Semantic Scholar recommendations (seed-based)
+    s2_source = None
     if getattr(config, "semantic_scholar_enabled", False):
         print("🧠 Fetching from Semantic Scholar recommendations...")
         s2_source = SemanticScholarSource(
@@ -118,9 +132,27 @@ async def fetch_papers(config: Config, days_back: int = 1) -> List[Paper]:
             memory_store=memory_store,
             seen_ttl_days=getattr(config, "semantic_seen_ttl_days", 30),
         )
-        s2_papers = await s2_source.fetch()
+        fetches["s2"] = s2_source.fetch()
+
+    results = dict(zip(fetches, await fetch_all(fetches.values())))
+
+    arxiv_papers = suppress_by_memory(results["arxiv"], "arXiv")
+    papers.extend(arxiv_papers)
+    print(f"   arXiv: found {len(arxiv_papers)} papers")
+
+    hf_papers = suppress_by_memory(results["hf"], "HuggingFace")
+    papers.extend(hf_papers)
+    print(f"   HuggingFace: found {len(hf_papers)} papers")
+
+    if "manual" in results:
+        manual_papers = results["manual"]
+        papers.extend(manual_papers)
+        print(f"   Manual: found {len(manual_papers)} papers")
+
+    if s2_source is not None:
+        s2_papers = results["s2"]
         papers.extend(s2_papers)
-        print(f"   Found {len(s2_papers)} papers")
+        print(f"   Semantic Scholar: found {len(s2_papers)} papers")
         stats = getattr(s2_source, "last_stats", None)
         if stats:
             print(
@@ -131,30 +163,36 @@ async def fetch_papers(config: Config, days_back: int = 1) -> List[Paper]:
             )
     
     # Deduplicate by arxiv_id or url
-    seen = set()
-    unique_papers = []
-    for p in papers:
-        key = p.arxiv_id or p.url
-        if key not in seen:
-            seen.add(key)
-            unique_papers.append(p)
+    unique_papers = dedupe_papers(papers)
     
     print(f"✅ Total unique papers: {len(unique_papers)}")
     return unique_papers
 
 
+_HREF_RE = re.compile(r'href=["\']([^"\']+)["\']', re.IGNORECASE)
+# scheme://netloc/path up to the query/fragment; anything with whitespace falls back to urlsplit
+_URL_PARTS_RE = re.compile(r"([A-Za-z][A-Za-z0-9+.-]*)://([^/?#\s]+)([^?#\s]*)(?=[?#]|$)")
+
+
+@lru_cache(maxsize=8192)
 def _normalize_url_for_match(url: str) -> str:
     """Normalize URL for robust report-to-paper matching."""
     if not url:
         return ""
+    url = url.strip()
+    # Fast path for plain absolute URLs: one regex match instead of urlsplit/urlunsplit.
+    m = _URL_PARTS_RE.match(url)
+    if m:
+        scheme, netloc, path = m.groups()
+        return f"{scheme.lower()}://{netloc.lower()}{path.rstrip('/')}"
     try:
-        parts = urlsplit(url.strip())
+        parts = urlsplit(url)
         scheme = parts.scheme.lower() if parts.scheme else "https"
         netloc = parts.netloc.lower()
         path = parts.path.rstrip("/")
         return urlunsplit((scheme, netloc, path, "", ""))
     except Exception:
-        return url.strip().lower().rstrip("/")
+        return url.lower().rstrip("/")
 
 
 def _extract_report_urls(report_html: str) -> set[str]:
@@ -162,7 +200,7 @@ def _extract_report_urls(report_html: str) -> set[str]:
     if not report_html:
         return set()
     urls = set()
-    for raw in re.findall(r'href=["\']([^"\']+)["\']', report_html, flags=re.IGNORECASE):
+    for raw in _HREF_RE.findall(report_html):
         norm = _normalize_url_for_match(raw)
         if norm:
             urls.add(norm)
@@ -429,6 +467,7 @@ async def summarize_papers(papers: list[Paper], config: Config, priority_blogs:
     debug_save_pdfs = getattr(config, 'debug_save_pdfs', False)
     debug_pdf_dir = getattr(config, 'debug_pdf_dir', 'debug_pdfs')
     pdf_max_pages = getattr(config, 'pdf_max_pages', 10)
+    pdf_cache_dir = getattr(config, 'pdf_cache_dir', '') or None
     
     summarizer = PaperSummarizer(
         api_key=config.llm_api_key,
@@ -437,14 +476,19 @@ async def summarize_papers(papers: list[Paper], config: Config, priority_blogs:
         research_interests=config.research_interests,
         debug_save_pdfs=debug_save_pdfs,
         debug_pdf_dir=debug_pdf_dir,
-        pdf_max_pages=pdf_max_pages
+        pdf_max_pages=pdf_max_pages,
+        pdf_cache_dir=pdf_cache_dir,
+        pdf_cache_ttl_days=getattr(config, 'pdf_cache_ttl_days', 7),
     )
     
     # 使用PDF多模态输入（如果模型支持）
-    report = await summarizer.generate_report(
-        all_content,
-        use_pdf_multimodal=config.extract_fulltext,
-    )
+    try:
+        report = await summarizer.generate_report(
+            all_content,
+            use_pdf_multimodal=config.extract_fulltext,
+        )
+    finally:
+        await summarizer.aclose()
     print("   ✅ Report generated!")
     return report
 
@@ -672,6 +716,18 @@ async def run_pipeline(config_path: str = "config.yaml", days_back: int = 1, dry
     print(f"   - Total in report: {len(final_papers) + len(all_blogs)}")
 
 
+def _configure_source_logging() -> None:
+    """Print paper-source progress to stdout, in line with the pipeline's own print output."""
+    # Scoped to the ``sources`` package: the root logger stays untouched, so httpx/openai
+    # request logging stays off, and a synchronous handler keeps ordering with print().
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    source_logger = logging.getLogger("sources")
+    source_logger.addHandler(handler)
+    source_logger.setLevel(logging.INFO)
+    source_logger.propagate = False
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="PaperFeeder AI Agent - Hunt for 'The Next Big Thing'",
@@ -709,14 +765,22 @@ Environment Variables:
     parser.add_argument("--no-papers", action="store_true", help="Disable paper fetching")
     
     args = parser.parse_args()
-    
-    asyncio.run(run_pipeline(
-        config_path=args.config,
-        days_back=args.days,
-        dry_run=args.dry_run,
-        no_papers=args.no_papers,
-        no_blogs=args.no_blogs
-    ))
+
+    async def _run() -> None:
+        try:
+            await run_pipeline(
+                config_path=args.config,
+                days_back=args.days,
+                dry_run=args.dry_run,
+                no_papers=args.no_papers,
+                no_blogs=args.no_blogs
+            )
+        finally:
+            # Release the HTTP session shared by the paper sources.
+            await close_session()
+
+    _configure_source_logging()
+    asyncio.run(_run())
 
 
 if __name__ == "__main__":
@@ -18,7 +18,7 @@ class PaperSource(Enum):
     OPENREVIEW = "openreview"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Author:
     name: str
     affiliation: Optional[str] = None
@@ -109,6 +109,14 @@ class Paper:
         )
 
 
+def dedupe_papers(papers: List[Paper]) -> List[Paper]:
+    """Drop repeats by arxiv_id (or url), keeping the first occurrence in order."""
+    unique: dict = {}
+    for paper in papers:
+        unique.setdefault(paper.arxiv_id or paper.url, paper)
+    return list(unique.values())
+
+
 @dataclass
 class DailyReport:
     date: datetime
@@ -6,21 +6,30 @@ import base64
 import hashlib
 import hmac
 import json
+import mmap
 import os
+import re
 import urllib.error
 import urllib.request
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import quote_plus
 from urllib.parse import urlsplit, urlunsplit
 
+import orjson
+
 from semantic_resolver import SemanticPaperResolver
 
 
 ALLOWED_LABELS = {"positive", "negative", "undecided"}
 DEFAULT_QUEUE_PATH = "semantic_feedback_queue.json"
+# Files at least this large are memory-mapped for parsing rather than read into memory.
+_MMAP_MIN_BYTES = 1 << 20
+_HREF_RE = re.compile(r'href=["\']([^"\']+)["\']', re.IGNORECASE)
 
 
 def _utc_now() -> datetime:
@@ -84,12 +93,11 @@ def normalize_paper_id(value: Any) -> str:
 
 
 def _extract_report_urls(report_html: str) -> set[str]:
-    import re
-
     if not report_html:
         return set()
-    raw_urls = re.findall(r'href=["\']([^"\']+)["\']', report_html, flags=re.IGNORECASE)
-    return {normalize_url(u) for u in raw_urls if normalize_url(u)}
+    urls = {normalize_url(u) for u in _HREF_RE.findall(report_html)}
+    urls.discard("")
+    return urls
 
 
 def build_run_id(now: datetime | None = None) -> str:
@@ -97,13 +105,25 @@ def build_run_id(now: datetime | None = None) -> str:
     return dt.strftime("%Y-%m-%dT%H-%M-%SZ")
 
 
+@lru_cache(maxsize=8)
+def _hmac_template(signing_secret: str) -> hmac.HMAC:
+    # Keyed once per secret; copies skip re-deriving the inner/outer pads.
+    return hmac.new(signing_secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def _sign(payload_b64: str, signing_secret: str) -> bytes:
+    h = _hmac_template(signing_secret).copy()
+    h.update(payload_b64.encode("ascii"))
+    return h.digest()
+
+
 def create_feedback_token(claims: Dict[str, Any], signing_secret: str) -> str:
     """Create signed token for one-click feedback links."""
     if not signing_secret:
         raise ValueError("signing_secret is required")
     payload_json = json.dumps(claims, separators=(",", ":"), sort_keys=True).encode("utf-8")
     payload_b64 = _b64url_encode(payload_json)
-    sig = hmac.new(signing_secret.encode("utf-8"), payload_b64.encode("ascii"), hashlib.sha256).digest()
+    sig = _sign(payload_b64, signing_secret)
     return f"{payload_b64}.{_b64url_encode(sig)}"
 
 
@@ -114,7 +134,7 @@ def verify_feedback_token(token: str, signing_secret: str) -> Dict[str, Any]:
     if not signing_secret:
         raise ValueError("signing_secret is required")
     payload_b64, sig_b64 = token.split(".", 1)
-    expected_sig = hmac.new(signing_secret.encode("utf-8"), payload_b64.encode("ascii"), hashlib.sha256).digest()
+    expected_sig = _sign(payload_b64, signing_secret)
     got_sig = _b64url_decode(sig_b64)
     if not hmac.compare_digest(expected_sig, got_sig):
         raise ValueError("invalid token signature")
@@ -297,7 +317,7 @@ def export_run_feedback_manifest(
     out_dir = Path(output_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
     manifest_path = out_dir / f"run_feedback_manifest_{rid}.json"
-    manifest_path.write_text(json.dumps(payload, indent=2) + "\n")
+    _write_json(manifest_path, payload)
 
     # Emit a starter questionnaire for direct copy/edit by reviewers.
     feedback_template = {
@@ -316,7 +336,7 @@ def export_run_feedback_manifest(
         ],
     }
     questionnaire_path = out_dir / f"semantic_feedback_template_{rid}.json"
-    questionnaire_path.write_text(json.dumps(feedback_template, indent=2) + "\n")
+    _write_json(questionnaire_path, feedback_template)
 
     return manifest_path, questionnaire_path
 
@@ -488,21 +508,30 @@ def publish_feedback_run_to_d1(
     _d1_execute(acc, tok, dbid, create_sql)
 
     upsert_sql = (
-        "INSERT INTO feedback_runs (run_id, created_at, report_html) VALUES ("
-        f"{_sql_quote(run_id)}, {_sql_quote(_to_iso(_utc_now()))}, {_sql_quote(report_html)}"
-        ") ON CONFLICT(run_id) DO UPDATE SET "
+        "INSERT INTO feedback_runs (run_id, created_at, report_html) VALUES (?, ?, ?) "
+        "ON CONFLICT(run_id) DO UPDATE SET "
         "created_at=excluded.created_at, report_html=excluded.report_html"
     )
-    _d1_execute(acc, tok, dbid, upsert_sql)
+    _d1_execute(acc, tok, dbid, upsert_sql, [run_id, _to_iso(_utc_now()), report_html])
     return run_id
 
 
+def _read_json_bytes(path: Path) -> Any:
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        # Large queues/manifests are parsed straight from the page cache instead of
+        # being copied into a bytes object first.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
 def _load_json(path: str) -> Dict[str, Any]:
     p = Path(path)
     if not p.exists():
         raise ValueError(f"File not found: {path}")
     try:
-        data = json.loads(p.read_text())
+        data = _read_json_bytes(p)
     except Exception as e:
         raise ValueError(f"Invalid JSON in {path}: {e}") from e
     if not isinstance(data, dict):
@@ -510,6 +539,14 @@ def _load_json(path: str) -> Dict[str, Any]:
     return data
 
 
+def _write_json(path: str | Path, data: Any) -> None:
+    # Temp file + rename so a crash mid-write never leaves a truncated seeds/queue file.
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    os.replace(tmp_path, path)
+
+
 def _load_json_or_default(path: str, default: Dict[str, Any]) -> Dict[str, Any]:
     p = Path(path)
     if not p.exists():
@@ -517,6 +554,19 @@ def _load_json_or_default(path: str, default: Dict[str, Any]) -> Dict[str, Any]:
     return _load_json(path)
 
 
+def _apply_seed_labels(seeds: Dict[str, Any], decided: Dict[str, str]) -> Tuple[set[str], set[str]]:
+    """Apply one final label per semantic id to the seed lists with whole-set operations."""
+    positive = {normalize_paper_id(v) for v in seeds.get("positive_paper_ids", []) or []}
+    negative = {normalize_paper_id(v) for v in seeds.get("negative_paper_ids", []) or []}
+    positive.discard("")
+    negative.discard("")
+    # Every decided id leaves both lists, then re-enters the one its label names
+    # (undecided ids stay out of both).
+    to_positive = {sid for sid, label in decided.items() if label == "positive"}
+    to_negative = {sid for sid, label in decided.items() if label == "negative"}
+    return (positive - decided.keys()) | to_positive, (negative - decided.keys()) | to_negative
+
+
 def _sort_seed_ids(values: Iterable[str]) -> List[str]:
     def sort_key(v: str) -> Tuple[int, str]:
         s = normalize_paper_id(v)
@@ -538,7 +588,7 @@ def _load_queue(path: str = DEFAULT_QUEUE_PATH) -> Dict[str, Any]:
 
 
 def _save_queue(data: Dict[str, Any], path: str = DEFAULT_QUEUE_PATH) -> None:
-    Path(path).write_text(json.dumps(data, indent=2) + "\n")
+    _write_json(path, data)
 
 
 def queue_feedback_event(
@@ -708,25 +758,10 @@ def apply_feedback_to_seeds(
     else:
         seeds = {}
 
-    positive = set(normalize_paper_id(v) for v in seeds.get("positive_paper_ids", []) or [])
-    negative = set(normalize_paper_id(v) for v in seeds.get("negative_paper_ids", []) or [])
-    positive.discard("")
-    negative.discard("")
-
-    applied_count = 0
-    for semantic_id, (_ts, label) in sorted(latest.items()):
-        if label == "positive":
-            positive.add(semantic_id)
-            negative.discard(semantic_id)
-            applied_count += 1
-        elif label == "negative":
-            negative.add(semantic_id)
-            positive.discard(semantic_id)
-            applied_count += 1
-        else:
-            positive.discard(semantic_id)
-            negative.discard(semantic_id)
-            applied_count += 1
+    positive, negative = _apply_seed_labels(
+        seeds, {semantic_id: label for semantic_id, (_ts, label) in latest.items()}
+    )
+    applied_count = len(latest)
 
     output = {
         "positive_paper_ids": _sort_seed_ids(positive),
@@ -734,7 +769,7 @@ def apply_feedback_to_seeds(
     }
 
     if not dry_run:
-        seeds_file.write_text(json.dumps(output, indent=2) + "\n")
+        _write_json(seeds_file, output)
 
     return {
         "feedback_path": feedback_path,
@@ -750,6 +785,19 @@ def apply_feedback_to_seeds(
     }
 
 
+# (created_at, event_id, label, event index) of the event currently winning a semantic id
+_Winner = Tuple[datetime, str, str, int]
+
+
+def _keep_latest(
+    winners: Dict[str, _Winner], semantic_id: str, ts: datetime, event_id: str, label: str, idx: int
+) -> None:
+    """Single-pass latest-wins: newest created_at per semantic id, event_id breaks ties."""
+    current = winners.get(semantic_id)
+    if current is None or (ts, event_id) > (current[0], current[1]):
+        winners[semantic_id] = (ts, event_id, label, idx)
+
+
 def apply_feedback_queue_to_seeds(
     manifest_path: str,
     queue_path: str = DEFAULT_QUEUE_PATH,
@@ -781,7 +829,7 @@ def apply_feedback_queue_to_seeds(
         and str(e.get("run_id", "")).strip() == m_run_id
     ]
 
-    winners: Dict[str, Tuple[datetime, str, int]] = {}
+    winners: Dict[str, _Winner] = {}
     invalid_count = 0
     skipped_count = 0
     rejected_count = 0
@@ -813,47 +861,28 @@ def apply_feedback_queue_to_seeds(
             continue
         e["resolved_semantic_paper_id"] = semantic_id
         ts = _parse_iso(str(e.get("created_at", ""))) or _utc_now()
-        current = winners.get(semantic_id)
-        if current is None:
-            winners[semantic_id] = (ts, label, idx)
-        else:
-            cur_ts, _cur_label, cur_idx = current
-            cur_event_id = str(events[cur_idx].get("event_id", ""))
-            this_event_id = str(e.get("event_id", ""))
-            if ts > cur_ts or (ts == cur_ts and this_event_id > cur_event_id):
-                winners[semantic_id] = (ts, label, idx)
+        _keep_latest(winners, semantic_id, ts, str(e.get("event_id", "")), label, idx)
 
     seeds_file = Path(seeds_path)
     seeds = _load_json_or_default(seeds_path, {})
-    positive = set(normalize_paper_id(v) for v in seeds.get("positive_paper_ids", []) or [])
-    negative = set(normalize_paper_id(v) for v in seeds.get("negative_paper_ids", []) or [])
-    positive.discard("")
-    negative.discard("")
 
     applied_count = 0
     now_iso = _to_iso(_utc_now())
-    winner_indices = {idx for (_ts, _label, idx) in winners.values()}
+    # Winning event indices from the scan above; each semantic id has exactly one winner.
+    winning_indices = {idx for _ts, _eid, _label, idx in winners.values()}
+    positive, negative = _apply_seed_labels(
+        seeds, {semantic_id: label for semantic_id, (_ts, _eid, label, _idx) in winners.items()}
+    )
 
     for idx in pending_indices:
         e = events[idx]
         if str(e.get("status", "")).lower() != "pending":
             continue
-        if idx not in winner_indices:
+        if idx not in winning_indices:
             e["status"] = "rejected"
             e["error"] = "superseded by newer event"
             rejected_count += 1
             continue
-        semantic_id = normalize_paper_id(e.get("resolved_semantic_paper_id"))
-        label = str(e.get("label", "")).strip().lower()
-        if label == "positive":
-            positive.add(semantic_id)
-            negative.discard(semantic_id)
-        elif label == "negative":
-            negative.add(semantic_id)
-            positive.discard(semantic_id)
-        else:
-            positive.discard(semantic_id)
-            negative.discard(semantic_id)
         e["status"] = "applied"
         e["applied_at"] = now_iso
         e["error"] = None
@@ -864,7 +893,7 @@ def apply_feedback_queue_to_seeds(
         "negative_paper_ids": _sort_seed_ids(negative),
     }
     if not dry_run:
-        seeds_file.write_text(json.dumps(output, indent=2) + "\n")
+        _write_json(seeds_file, output)
         _save_queue(queue, queue_path)
 
     return {
@@ -883,20 +912,32 @@ def apply_feedback_queue_to_seeds(
     }
 
 
-def _sql_quote(value: Any) -> str:
-    if value is None:
-        return "NULL"
-    return "'" + str(value).replace("'", "''") + "'"
+_UPDATE_EVENT_SQL = (
+    "UPDATE feedback_events SET status=?, applied_at=?, error=?, resolved_semantic_paper_id=? "
+    "WHERE event_id=?"
+)
+
 
+def _d1_query(
+    account_id: str,
+    api_token: str,
+    database_id: str,
+    sql: str,
+    params: List[Any] | None = None,
+) -> List[Dict[str, Any]]:
+    """Execute SQL against Cloudflare D1 via REST API and return rows.
 
-def _d1_query(account_id: str, api_token: str, database_id: str, sql: str) -> List[Dict[str, Any]]:
-    """Execute SQL against Cloudflare D1 via REST API and return rows."""
+    Values are bound through D1's ``?`` placeholders instead of being quoted into the SQL text.
+    """
     if not account_id or not api_token or not database_id:
         raise ValueError("account_id, api_token, and database_id are required for D1 query")
     url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/d1/database/{database_id}/query"
+    body: Dict[str, Any] = {"sql": sql}
+    if params:
+        body["params"] = params
     req = urllib.request.Request(
         url,
-        data=json.dumps({"sql": sql}).encode("utf-8"),
+        data=orjson.dumps(body),
         headers={
             "Authorization": f"Bearer {api_token}",
             "Content-Type": "application/json",
@@ -905,7 +946,7 @@ def _d1_query(account_id: str, api_token: str, database_id: str, sql: str) -> Li
     )
     try:
         with urllib.request.urlopen(req, timeout=30) as resp:
-            payload = json.loads(resp.read().decode("utf-8"))
+            payload = orjson.loads(resp.read())
     except urllib.error.HTTPError as e:
         details = e.read().decode("utf-8", errors="ignore")
         raise RuntimeError(f"D1 HTTP error {e.code}: {details}") from e
@@ -921,8 +962,14 @@ def _d1_query(account_id: str, api_token: str, database_id: str, sql: str) -> Li
     return rows if isinstance(rows, list) else []
 
 
-def _d1_execute(account_id: str, api_token: str, database_id: str, sql: str) -> None:
-    _ = _d1_query(account_id, api_token, database_id, sql)
+def _d1_execute(
+    account_id: str,
+    api_token: str,
+    database_id: str,
+    sql: str,
+    params: List[Any] | None = None,
+) -> None:
+    _ = _d1_query(account_id, api_token, database_id, sql, params)
 
 
 def _build_manifest_index(
@@ -1007,24 +1054,27 @@ def apply_feedback_d1_to_seeds(
         raise ValueError("Missing D1 credentials (account_id/api_token/database_id)")
 
     where = "status='pending'"
+    params: List[Any] = []
     if run_id_filter:
-        where += f" AND run_id={_sql_quote(run_id_filter)}"
+        where += " AND run_id=?"
+        params.append(run_id_filter)
     sql = (
         "SELECT event_id, run_id, item_id, label, reviewer, created_at, source, status, "
         "resolved_semantic_paper_id, applied_at, error "
         f"FROM feedback_events WHERE {where} ORDER BY created_at ASC, event_id ASC"
     )
-    rows = _normalize_d1_rows(_d1_query(acc, tok, dbid, sql))
-
-    manifest_index = _build_manifest_index(manifest_file=manifest_file, manifests_dir=manifests_dir)
-
-    seeds = _load_json_or_default(seeds_path, {})
-    positive = set(normalize_paper_id(v) for v in seeds.get("positive_paper_ids", []) or [])
-    negative = set(normalize_paper_id(v) for v in seeds.get("negative_paper_ids", []) or [])
-    positive.discard("")
-    negative.discard("")
+    # The D1 round-trip and local manifest/seed reads are independent; overlap them.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        rows_future = pool.submit(_d1_query, acc, tok, dbid, sql, params)
+        manifest_future = pool.submit(
+            _build_manifest_index, manifest_file=manifest_file, manifests_dir=manifests_dir
+        )
+        seeds_future = pool.submit(_load_json_or_default, seeds_path, {})
+        rows = _normalize_d1_rows(rows_future.result())
+        manifest_index = manifest_future.result()
+        seeds = seeds_future.result()
 
-    winners: Dict[str, Tuple[datetime, str, int]] = {}
+    winners: Dict[str, _Winner] = {}
     invalid_count = 0
     skipped_count = 0
     rejected_count = 0
@@ -1040,7 +1090,8 @@ def apply_feedback_d1_to_seeds(
             invalid_count += 1
             rejected_count += 1
             continue
-        semantic_id = normalize_paper_id(e.get("resolved_semantic_paper_id", ""))
+        # Already normalized by _normalize_d1_rows.
+        semantic_id = e.get("resolved_semantic_paper_id", "")
         if not semantic_id:
             run_id = str(e.get("run_id", ""))
             item_id = str(e.get("item_id", ""))
@@ -1055,39 +1106,23 @@ def apply_feedback_d1_to_seeds(
             continue
         e["resolved_semantic_paper_id"] = semantic_id
         ts = _parse_iso(str(e.get("created_at", ""))) or _utc_now()
-        current = winners.get(semantic_id)
-        if current is None:
-            winners[semantic_id] = (ts, label, idx)
-        else:
-            cur_ts, _cur_label, cur_idx = current
-            cur_eid = str(rows[cur_idx].get("event_id", ""))
-            this_eid = str(e.get("event_id", ""))
-            if ts > cur_ts or (ts == cur_ts and this_eid > cur_eid):
-                winners[semantic_id] = (ts, label, idx)
+        _keep_latest(winners, semantic_id, ts, str(e.get("event_id", "")), label, idx)
 
     applied_count = 0
     now_iso = _to_iso(_utc_now())
-    winner_indices = {idx for (_ts, _label, idx) in winners.values()}
+    winning_indices = {idx for _ts, _eid, _label, idx in winners.values()}
+    positive, negative = _apply_seed_labels(
+        seeds, {semantic_id: label for semantic_id, (_ts, _eid, label, _idx) in winners.items()}
+    )
 
     for idx, e in enumerate(rows):
         if e.get("status") != "pending":
             continue
-        if idx not in winner_indices:
+        if idx not in winning_indices:
             e["status"] = "rejected"
             e["error"] = "superseded by newer event"
             rejected_count += 1
             continue
-        semantic_id = normalize_paper_id(e.get("resolved_semantic_paper_id"))
-        label = str(e.get("label", "")).strip().lower()
-        if label == "positive":
-            positive.add(semantic_id)
-            negative.discard(semantic_id)
-        elif label == "negative":
-            negative.add(semantic_id)
-            positive.discard(semantic_id)
-        else:
-            positive.discard(semantic_id)
-            negative.discard(semantic_id)
         e["status"] = "applied"
         e["applied_at"] = now_iso
         e["error"] = None
@@ -1099,7 +1134,7 @@ def apply_feedback_d1_to_seeds(
     }
 
     if not dry_run:
-        Path(seeds_path).write_text(json.dumps(output, indent=2) + "\n")
+        _write_json(seeds_path, output)
         for e in rows:
             event_id = str(e.get("event_id", ""))
             if not event_id:
@@ -1107,15 +1142,14 @@ def apply_feedback_d1_to_seeds(
             status = str(e.get("status", "pending"))
             if status not in {"applied", "rejected"}:
                 continue
-            update_sql = (
-                "UPDATE feedback_events SET "
-                f"status={_sql_quote(status)}, "
-                f"applied_at={_sql_quote(e.get('applied_at')) if e.get('applied_at') else 'NULL'}, "
-                f"error={_sql_quote(e.get('error')) if e.get('error') else 'NULL'}, "
-                f"resolved_semantic_paper_id={_sql_quote(e.get('resolved_semantic_paper_id')) if e.get('resolved_semantic_paper_id') else 'NULL'} "
-                f"WHERE event_id={_sql_quote(event_id)}"
-            )
-            _d1_execute(acc, tok, dbid, update_sql)
+            update_params = [
+                status,
+                e.get("applied_at") or None,
+                e.get("error") or None,
+                e.get("resolved_semantic_paper_id") or None,
+                event_id,
+            ]
+            _d1_execute(acc, tok, dbid, _UPDATE_EVENT_SQL, update_params)
 
     return {
         "mode": "d1",
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import json
+import heapq
+import os
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, Set
+from typing import Any, Dict, Iterable, List, Set, Tuple
 from urllib.parse import urlsplit, urlunsplit
 
+import orjson
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -111,46 +114,104 @@ class SemanticMemoryStore:
         self.path = Path(path)
         self.max_ids = max_ids
         self.state = SemanticMemoryState()
+        # paper_id -> parsed seen timestamp, kept in sync with state.seen
+        self._parsed: Dict[str, datetime] = {}
+        # Min-heap of (seen_at, paper_id) so expiry pruning only touches expired entries.
+        # Entries go stale when an id is re-marked; they are skipped on pop.
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+        # ttl_days -> (oldest member's seen_at, ids live for that ttl); cleared on every mutation
+        self._live_ids: Dict[int, Tuple[datetime | None, frozenset[str]]] = {}
+        # True when in-memory state differs from what is on disk
+        self._dirty = False
 
     def load(self) -> None:
+        self._parsed = {}
+        self._expiry_heap = []
+        self._live_ids = {}
+        self._dirty = False
         if not self.path.exists():
             self.state = SemanticMemoryState(updated_at=_to_iso(_utcnow()))
+            self._dirty = True
             return
 
         try:
-            data = json.loads(self.path.read_text())
+            data = orjson.loads(self.path.read_bytes())
             seen = data.get("seen", {})
             if not isinstance(seen, dict):
                 raise ValueError("seen must be an object")
-            normalized_seen: Dict[str, str] = {}
-            for paper_id, ts in seen.items():
-                if not paper_id:
-                    continue
-                parsed = _parse_iso(str(ts))
-                if parsed is None:
-                    continue
-                normalized_seen[str(paper_id)] = _to_iso(parsed)
+            # Parse each timestamp once; stored strings round-trip unchanged.
+            parsed_seen = {
+                paper_id: parsed
+                for paper_id, ts in seen.items()
+                if paper_id and (parsed := _parse_iso(str(ts))) is not None
+            }
             updated_at = data.get("updated_at", "")
             self.state = SemanticMemoryState(
-                seen=normalized_seen,
+                seen={paper_id: str(seen[paper_id]) for paper_id in parsed_seen},
                 updated_at=updated_at if isinstance(updated_at, str) else "",
             )
+            self._parsed = parsed_seen
+            self._dirty = len(parsed_seen) != len(seen)
         except Exception as e:
             print(f"      ⚠️ Semantic memory invalid, resetting: {e}")
             self.state = SemanticMemoryState(updated_at=_to_iso(_utcnow()))
+            self._parsed = {}
+            self._dirty = True
 
+        self._rebuild_expiry_heap()
         self.prune_to_cap()
 
+    def _live_id_set(self, ttl_days: int) -> frozenset[str]:
+        """IDs seen within ttl_days, reused until a mutation or until its oldest member expires."""
+        cutoff = _utcnow() - timedelta(days=ttl_days)
+        cached = self._live_ids.get(ttl_days)
+        if cached is not None and (cached[0] is None or cached[0] >= cutoff):
+            return cached[1]
+        live = {pid: dt for pid, dt in self._parsed.items() if dt >= cutoff}
+        ids = frozenset(live)
+        self._live_ids[ttl_days] = (min(live.values(), default=None), ids)
+        return ids
+
+    def _rebuild_expiry_heap(self) -> None:
+        self._expiry_heap = [(dt, pid) for pid, dt in self._parsed.items()]
+        heapq.heapify(self._expiry_heap)
+
+    def _seen_at(self, paper_id: str, ts: str) -> datetime | None:
+        parsed = self._parsed.get(paper_id)
+        if parsed is None:
+            parsed = _parse_iso(ts)
+            if parsed is not None:
+                self._parsed[paper_id] = parsed
+        return parsed
+
     def save(self) -> None:
-        self.state.updated_at = _to_iso(_utcnow())
         self.prune_to_cap()
-        self.path.write_text(json.dumps(self.state.to_dict(), indent=2) + "\n")
+        if not self._dirty:
+            return
+        self.state.updated_at = _to_iso(_utcnow())
+        # Write to a sibling temp file and swap it in so a crash never leaves
+        # a truncated memory file behind.
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_bytes(
+            orjson.dumps(self.state.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+        os.replace(tmp_path, self.path)
+        self._dirty = False
 
     def mark_seen(self, paper_ids: Iterable[str], at: datetime | None = None) -> None:
-        ts = _to_iso(at or _utcnow())
-        for pid in paper_ids:
-            if pid:
-                self.state.seen[str(pid)] = ts
+        dt = (at or _utcnow()).astimezone(timezone.utc)
+        ts = _to_iso(dt)
+        # One timestamp for the whole batch; ids are only stringified once each.
+        marked = [str(pid) for pid in paper_ids if pid]
+        for pid in marked:
+            self.state.seen[pid] = ts
+            self._parsed[pid] = dt
+            heapq.heappush(self._expiry_heap, (dt, pid))
+        if marked:
+            self._live_ids.clear()
+            self._dirty = True
+        if len(self._expiry_heap) > 2 * len(self._parsed) + 64:
+            self._rebuild_expiry_heap()
         self.prune_to_cap()
 
     def recently_seen(self, paper_id: str, ttl_days: int, now: datetime | None = None) -> bool:
@@ -159,32 +220,50 @@ class SemanticMemoryStore:
         seen_at = self.state.seen.get(str(paper_id))
         if not seen_at:
             return False
-        parsed = _parse_iso(seen_at)
+        parsed = self._seen_at(str(paper_id), seen_at)
         if parsed is None:
             return False
         cutoff = (now or _utcnow()) - timedelta(days=ttl_days)
         return parsed >= cutoff
 
     def filter_recently_seen(self, paper_ids: Iterable[str], ttl_days: int) -> Set[str]:
-        now = _utcnow()
-        return {pid for pid in paper_ids if self.recently_seen(pid, ttl_days, now=now)}
+        return set(paper_ids) & self._live_id_set(ttl_days)
 
     def recently_seen_any(self, paper_ids: Iterable[str], ttl_days: int, now: datetime | None = None) -> bool:
-        now_v = now or _utcnow()
-        for pid in paper_ids:
-            if self.recently_seen(str(pid), ttl_days, now=now_v):
+        if now is None:
+            return not self._live_id_set(ttl_days).isdisjoint(map(str, paper_ids))
+        cutoff = now - timedelta(days=ttl_days)
+        for pid in map(str, paper_ids):
+            seen_at = self._parsed.get(pid)
+            if seen_at is not None and seen_at >= cutoff:
                 return True
         return False
 
-    def prune_expired(self, ttl_days: int) -> int:
-        cutoff = _utcnow() - timedelta(days=ttl_days)
-        before = len(self.state.seen)
-        self.state.seen = {
-            pid: ts
+    def seen_arxiv_ids(self, ttl_days: int, now: datetime | None = None) -> Set[str]:
+        """Bare arXiv IDs (the part after ``arxiv:``) seen within ttl_days."""
+        cutoff = (now or _utcnow()) - timedelta(days=ttl_days)
+        return {
+            pid[len("arxiv:"):]
             for pid, ts in self.state.seen.items()
-            if (parsed := _parse_iso(ts)) is not None and parsed >= cutoff
+            if pid.startswith("arxiv:")
+            and (parsed := self._seen_at(pid, ts)) is not None
+            and parsed >= cutoff
         }
-        return before - len(self.state.seen)
+
+    def prune_expired(self, ttl_days: int) -> int:
+        cutoff = _utcnow() - timedelta(days=ttl_days)
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] < cutoff:
+            seen_at, pid = heapq.heappop(heap)
+            if self._parsed.get(pid) == seen_at:
+                del self._parsed[pid]
+                del self.state.seen[pid]
+                removed += 1
+        if removed:
+            self._live_ids.clear()
+            self._dirty = True
+        return removed
 
     def prune_to_cap(self) -> int:
         if len(self.state.seen) <= self.max_ids:
@@ -192,10 +271,15 @@ class SemanticMemoryStore:
         # Keep most recent entries.
         sorted_items = sorted(
             self.state.seen.items(),
-            key=lambda kv: _parse_iso(kv[1]) or datetime.min.replace(tzinfo=timezone.utc),
+            key=lambda kv: self._seen_at(kv[0], kv[1]) or datetime.min.replace(tzinfo=timezone.utc),
             reverse=True,
         )
         kept = dict(sorted_items[: self.max_ids])
         removed = len(self.state.seen) - len(kept)
         self.state.seen = kept
+        self._parsed = {pid: self._parsed[pid] for pid in kept if pid in self._parsed}
+        self._rebuild_expiry_heap()
+        self._live_ids.clear()
+        if removed:
+            self._dirty = True
         return removed
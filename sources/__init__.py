@@ -1,4 +1,5 @@
-from .base import BaseSource
+from .base import BaseSource, get_session, close_session, fetch_all
+from .http_cache import HttpCache
 from .blog_sources import BlogSource, JinaReaderSource
 from .paper_sources import (
     ArxivSource,
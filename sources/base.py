@@ -2,12 +2,80 @@
 Base source classes for paper and blog sources.
 """
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Awaitable, Iterable, List, Optional
+
+import aiohttp
 
 from models import Paper
 
 
+logger = logging.getLogger(__name__)
+
+# Shared HTTP session so keep-alive connections, the connection pool and the
+# DNS cache are reused across sources. Bound to the event loop that created it.
+_SESSION: Optional[aiohttp.ClientSession] = None
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use.
+
+    The session is bound to one event loop; call ``close_session()`` before that loop
+    ends. A session left behind by an earlier loop is closed before it is replaced.
+    """
+    global _SESSION, _SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is not loop:
+        if _SESSION is not None and not _SESSION.closed:
+            try:
+                await _SESSION.close()
+            except Exception as e:
+                logger.warning(f"      ⚠️ Failed to close stale HTTP session: {e}")
+        _SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            ),
+            trust_env=True,
+            timeout=aiohttp.ClientTimeout(total=120, connect=30, sock_read=90),
+        )
+        _SESSION_LOOP = loop
+    return _SESSION
+
+
+async def close_session() -> None:
+    """Close the shared session (call once on shutdown)."""
+    global _SESSION, _SESSION_LOOP
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+    _SESSION_LOOP = None
+
+
+async def fetch_all(fetches: Iterable[Awaitable[List[Paper]]]) -> List[List[Paper]]:
+    """Run source fetches concurrently; a failing source yields an empty list.
+
+    Only ``Exception`` is swallowed: cancellation, ``KeyboardInterrupt`` and
+    ``SystemExit`` are re-raised so an aborted run does not carry on with partial data.
+    """
+    results = await asyncio.gather(*fetches, return_exceptions=True)
+    out: List[List[Paper]] = []
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning(f"      ⚠️ Source fetch failed: {type(result).__name__}: {result}")
+            out.append([])
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            out.append(result)
+    return out
+
+
 class BaseSource(ABC):
     """Abstract base class for all paper sources."""
 
@@ -0,0 +1,76 @@
+"""
+On-disk HTTP response cache revalidated with ETag / Last-Modified.
+
+Bodies are stored verbatim next to a small JSON sidecar holding the
+validators, so a 304 Not Modified can be answered from disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple
+
+import orjson
+
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """Store response bodies keyed by request URL."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+
+    def _paths(self, key: str) -> Tuple[Path, Path]:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.body", self.cache_dir / f"{digest}.meta.json"
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """Return If-None-Match / If-Modified-Since headers for a cached entry."""
+        body_path, meta_path = self._paths(key)
+        if not body_path.exists():
+            return {}
+        try:
+            meta = orjson.loads(meta_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        headers: Dict[str, str] = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def load(self, key: str) -> Optional[bytes]:
+        body_path, _ = self._paths(key)
+        try:
+            return body_path.read_bytes()
+        except OSError:
+            return None
+
+    def store(self, key: str, body: bytes, headers: Mapping[str, str]) -> None:
+        """Persist body + validators; responses without validators are not cached."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        body_path, meta_path = self._paths(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _write_atomic(body_path, body)
+            _write_atomic(
+                meta_path,
+                orjson.dumps({"url": key, "etag": etag, "last_modified": last_modified}),
+            )
+        except OSError as e:
+            logger.warning(f"      ⚠️ HTTP cache write failed: {e}")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
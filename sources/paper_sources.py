@@ -7,15 +7,109 @@ from __future__ import annotations
 
 import asyncio
 import aiohttp
-import json
-import xml.etree.ElementTree as ET
+import copy
+import io
+import logging
+import os
+import random
+import sys
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional, List, Dict, Any
+from email.utils import parsedate_to_datetime
+from typing import Iterator, Optional, List, Dict, Any, Set, Tuple
+from urllib.parse import urlencode
 import re
 
-from models import Paper, Author, PaperSource
-from .base import BaseSource
-from semantic_memory import SemanticMemoryStore, memory_keys_for_paper
+import orjson
+from lxml import etree
+
+from models import Paper, Author, PaperSource, dedupe_papers
+from .base import BaseSource, get_session
+from .http_cache import HttpCache
+from semantic_memory import SemanticMemoryStore, memory_keys_for_paper, normalize_arxiv_id
+
+
+logger = logging.getLogger(__name__)
+
+
+# Ask for compressed bodies explicitly; aiohttp decodes br only when brotli is installed.
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+_HEADERS = {"Accept-Encoding": _ACCEPT_ENCODING, "User-Agent": "PaperFeeder/1.0"}
+
+
+# arXiv Atom feed parsing (shared by ArxivSource and ManualSource)
+ATOM_NS = "http://www.w3.org/2005/Atom"
+ARXIV_NS = {"atom": ATOM_NS, "arxiv": "http://arxiv.org/schemas/atom"}
+ATOM_ENTRY_TAG = f"{{{ATOM_NS}}}entry"
+
+_ARXIV_URL_RE = re.compile(r"arxiv\.org/(?:abs|pdf)/(\d+\.\d+)")
+_ARXIV_VERSION_RE = re.compile(r"v\d+$")
+
+_X_ID = etree.XPath("string(atom:id)", namespaces=ARXIV_NS, smart_strings=False)
+_X_TITLE = etree.XPath("string(atom:title)", namespaces=ARXIV_NS, smart_strings=False)
+_X_SUMMARY = etree.XPath("string(atom:summary)", namespaces=ARXIV_NS, smart_strings=False)
+_X_PUBLISHED = etree.XPath("string(atom:published)", namespaces=ARXIV_NS, smart_strings=False)
+_X_AUTHORS = etree.XPath("atom:author", namespaces=ARXIV_NS)
+_X_AUTHOR_NAME = etree.XPath("string(atom:name)", namespaces=ARXIV_NS, smart_strings=False)
+_X_AUTHOR_AFFILIATION = etree.XPath("string(arxiv:affiliation)", namespaces=ARXIV_NS, smart_strings=False)
+_X_CATEGORIES = etree.XPath("atom:category/@term", namespaces=ARXIV_NS, smart_strings=False)
+_X_PDF_LINK = etree.XPath("atom:link[@title='pdf']/@href", namespaces=ARXIV_NS, smart_strings=False)
+
+
+def _iter_atom_entries(raw: bytes) -> Iterator[etree._Element]:
+    """Stream <entry> elements from an Atom feed, freeing each one after use."""
+    for _, entry in etree.iterparse(io.BytesIO(raw), tag=ATOM_ENTRY_TAG):
+        try:
+            yield entry
+        finally:
+            _release_element(entry)
+
+
+def _release_element(entry: etree._Element) -> None:
+    entry.clear()
+    while entry.getprevious() is not None:
+        del entry.getparent()[0]
+
+
+_WS_RE = re.compile(r"\s+")
+# arXiv API terms of use: no more than one request every three seconds.
+_ARXIV_REQUEST_INTERVAL = 3.0
+
+
+def _clean_text(text: str) -> str:
+    """Collapse newlines and runs of whitespace into single spaces."""
+    return _WS_RE.sub(" ", text).strip()
+
+
+MAX_RETRY_BACKOFF_SECONDS = 60.0
+
+
+def _retry_backoff(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retrying: the server's Retry-After if given, else jittered exponential."""
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            return min(max(delay, 0.0), MAX_RETRY_BACKOFF_SECONDS)
+    return min(random.uniform(0.5, 1.5) * (2 ** (attempt + 1)), MAX_RETRY_BACKOFF_SECONDS)
+
+
+if sys.version_info >= (3, 11):
+    # 3.11+ accepts the trailing "Z" natively.
+    _parse_iso_z = datetime.fromisoformat
+else:
+    def _parse_iso_z(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 
 class ArxivSource(BaseSource):
@@ -23,31 +117,63 @@ class ArxivSource(BaseSource):
     
     BASE_URL = "http://export.arxiv.org/api/query"
     
-    def __init__(self, categories: list[str]):
+    def __init__(self, categories: list[str], http_cache: Optional[HttpCache] = None):
         self.categories = categories
+        self.http_cache = http_cache
     
-    async def fetch(self, days_back: int = 1, max_results: int = 200) -> List[Paper]:
-        """Fetch recent papers from specified categories."""
-        papers = []
+    async def fetch(
+        self,
+        days_back: int = 1,
+        max_results: int = 200,
+        seen_ids: Optional[Set[str]] = None,
+    ) -> List[Paper]:
+        """Fetch recent papers from specified categories.
+
+        Each category is queried on its own with the full ``max_results``, one request at a
+        time spaced by arXiv's three-second limit, so a busy category cannot crowd out the
+        others. Results are merged with ``dedupe_papers`` and the newest ``max_results`` kept.
+        Entries whose normalized arXiv ID is in ``seen_ids`` are skipped before field extraction.
+        """
+        if not self.categories:
+            return []
+        
+        logger.info(f"      Querying {len(self.categories)} categories: {', '.join(self.categories)[:60]}...")
+        logger.info(f"      (arXiv API can be slow, ~10-60s, please wait...)")
         
-        # Build category query
-        cat_query = " OR ".join([f"cat:{cat}" for cat in self.categories])
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+        papers: List[Paper] = []
+        for i, category in enumerate(self.categories):
+            if i:
+                await asyncio.sleep(_ARXIV_REQUEST_INTERVAL)
+            papers.extend(await self._fetch_query(f"cat:{category}", max_results, cutoff_date, seen_ids))
+        
+        merged = dedupe_papers(papers)
+        merged.sort(key=lambda p: p.published_date or cutoff_date, reverse=True)
+        return merged[:max_results]
+    
+    async def _fetch_query(
+        self,
+        search_query: str,
+        max_results: int,
+        cutoff_date: datetime,
+        seen_ids: Optional[Set[str]] = None,
+    ) -> List[Paper]:
+        """Run the (retrying) arXiv query and parse the recent entries."""
+        papers = []
         
         # arXiv API parameters
         params = {
-            "search_query": cat_query,
+            "search_query": search_query,
             "start": 0,
             "max_results": max_results,
             "sortBy": "submittedDate",
             "sortOrder": "descending",
         }
         
-        print(f"      Querying: {cat_query[:60]}...")
-        print(f"      (arXiv API can be slow, ~10-60s, please wait...)")
+        cache_key = f"{self.BASE_URL}?{urlencode(params)}"
         
         # 重试机制
         max_retries = 3
-        xml_content = None
         
         for attempt in range(max_retries):
             try:
@@ -57,97 +183,147 @@ class ArxivSource(BaseSource):
                     connect=30,     # 连接超时
                     sock_read=90    # 读取超时
                 )
-                async with aiohttp.ClientSession(timeout=timeout, trust_env=True) as session:
-                    async with session.get(self.BASE_URL, params=params) as response:
-                        if response.status != 200:
-                            print(f"      ❌ arXiv API error: {response.status}")
-                            return papers
-                        
-                        print(f"      ✓ Response received, reading data...")
-                        xml_content = await response.text()
-                        print(f"      ✓ Got {len(xml_content)} bytes, parsing XML...")
-                        break  # 成功，退出重试循环
+                headers = dict(_HEADERS)
+                if self.http_cache:
+                    headers.update(self.http_cache.conditional_headers(cache_key))
+                session = await get_session()
+                async with session.get(self.BASE_URL, params=params, headers=headers, timeout=timeout) as response:
+                    if response.status == 304 and self.http_cache:
+                        cached = self.http_cache.load(cache_key)
+                        if cached is not None:
+                            logger.info(f"      ✓ Not modified, replaying cached response...")
+                            papers = await asyncio.to_thread(self._parse_body, cached, cutoff_date, seen_ids)
+                            break
+                    if response.status != 200:
+                        logger.error(f"      ❌ arXiv API error: {response.status}")
+                        return papers
+                    
+                    logger.info(f"      ✓ Response received, streaming XML...")
+                    papers = await self._read_entries(response, cutoff_date, cache_key, seen_ids)
+                    break  # 成功，退出重试循环
                         
             except asyncio.TimeoutError:
-                print(f"      ⚠️ Timeout on attempt {attempt + 1}/{max_retries}")
+                logger.warning(f"      ⚠️ Timeout on attempt {attempt + 1}/{max_retries}")
                 if attempt < max_retries - 1:
-                    print(f"      Retrying in 5 seconds...")
+                    logger.info(f"      Retrying in 5 seconds...")
                     await asyncio.sleep(5)
                 else:
-                    print(f"      ❌ All retries failed. arXiv may be overloaded.")
+                    logger.error(f"      ❌ All retries failed. arXiv may be overloaded.")
                     return papers
             except asyncio.CancelledError:
-                print(f"      ❌ Request cancelled")
+                logger.error(f"      ❌ Request cancelled")
                 return papers
             except Exception as e:
-                print(f"      ❌ Request failed: {type(e).__name__}: {e}")
+                logger.error(f"      ❌ Request failed: {type(e).__name__}: {e}")
                 if attempt < max_retries - 1:
-                    print(f"      Retrying in 5 seconds...")
+                    logger.info(f"      Retrying in 5 seconds...")
                     await asyncio.sleep(5)
                 else:
                     return papers
         
-        if not xml_content:
-            return papers
+        return papers
+    
+    async def _read_entries(
+        self,
+        response: aiohttp.ClientResponse,
+        cutoff_date: datetime,
+        cache_key: str = "",
+        seen_ids: Optional[Set[str]] = None,
+    ) -> List[Paper]:
+        """Read the response body and parse it once in a worker thread.
+
+        One lxml parser must stay on one thread, so the whole body is handed to
+        ``_parse_body`` rather than feeding a shared parser chunk by chunk.
+        """
+        body = await response.read()
+        papers = await asyncio.to_thread(self._parse_body, body, cutoff_date, seen_ids)
+        logger.info(f"      ✓ Got {len(body)} bytes, parsed {len(papers)} papers")
+        # Only keep the raw body when the response can be revalidated later.
+        if self.http_cache and cache_key and ("ETag" in response.headers or "Last-Modified" in response.headers):
+            self.http_cache.store(cache_key, body, response.headers)
+        return papers
+    
+    def _parse_body(
+        self,
+        body: bytes,
+        cutoff_date: datetime,
+        seen_ids: Optional[Set[str]] = None,
+    ) -> List[Paper]:
+        parser = etree.XMLPullParser(events=("end",), tag=ATOM_ENTRY_TAG)
+        papers: List[Paper] = []
+        self._feed_and_drain(parser, body, cutoff_date, papers, seen_ids)
+        self._feed_and_drain(parser, None, cutoff_date, papers, seen_ids)
+        return papers
+    
+    def _feed_and_drain(
+        self,
+        parser: etree.XMLPullParser,
+        chunk: Optional[bytes],
+        cutoff_date: datetime,
+        papers: List[Paper],
+        seen_ids: Optional[Set[str]] = None,
+    ) -> None:
+        """Feed one chunk (None closes the parser) and collect finished entries."""
+        if chunk is None:
+            parser.close()
+        else:
+            parser.feed(chunk)
+        self._drain_entries(parser, cutoff_date, papers, seen_ids)
+    
+    def _drain_entries(
+        self,
+        parser: etree.XMLPullParser,
+        cutoff_date: datetime,
+        papers: List[Paper],
+        seen_ids: Optional[Set[str]] = None,
+    ) -> None:
+        for _, entry in parser.read_events():
+            try:
+                paper = self._parse_entry(entry, cutoff_date, seen_ids)
+                if paper is not None:
+                    papers.append(paper)
+            except Exception as e:
+                logger.warning(f"Error parsing arXiv entry: {e}")
+            finally:
+                _release_element(entry)
+    
+    @staticmethod
+    def _parse_entry(
+        entry: etree._Element,
+        cutoff_date: datetime,
+        seen_ids: Optional[Set[str]] = None,
+    ) -> Optional[Paper]:
+        """Build a Paper from one Atom <entry>; None if already seen or older than cutoff."""
+        # Extract arxiv ID from URL
+        arxiv_url = _X_ID(entry)
+        arxiv_id = arxiv_url.split("/abs/")[-1]
+        if seen_ids and normalize_arxiv_id(arxiv_id) in seen_ids:
+            return None
         
-        # Parse XML response
-        root = ET.fromstring(xml_content)
-        ns = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
+        published_date = _parse_iso_z(_X_PUBLISHED(entry))
         
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+        # Skip if too old
+        if published_date < cutoff_date:
+            return None
         
-        for entry in root.findall("atom:entry", ns):
-            try:
-                # Parse date
-                published_str = entry.find("atom:published", ns).text
-                published_date = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
-                
-                # Skip if too old
-                if published_date < cutoff_date:
-                    continue
-                
-                # Extract arxiv ID from URL
-                arxiv_url = entry.find("atom:id", ns).text
-                arxiv_id = arxiv_url.split("/abs/")[-1]
-                
-                # Extract authors
-                authors = []
-                for author_elem in entry.findall("atom:author", ns):
-                    name = author_elem.find("atom:name", ns).text
-                    affiliation_elem = author_elem.find("arxiv:affiliation", ns)
-                    affiliation = affiliation_elem.text if affiliation_elem is not None else None
-                    authors.append(Author(name=name, affiliation=affiliation))
-                
-                # Extract categories
-                categories = []
-                for cat_elem in entry.findall("atom:category", ns):
-                    categories.append(cat_elem.get("term"))
-                
-                # Find PDF link
-                pdf_url = None
-                for link in entry.findall("atom:link", ns):
-                    if link.get("title") == "pdf":
-                        pdf_url = link.get("href")
-                        break
-                
-                paper = Paper(
-                    title=entry.find("atom:title", ns).text.replace("\n", " ").strip(),
-                    abstract=entry.find("atom:summary", ns).text.replace("\n", " ").strip(),
-                    url=arxiv_url,
-                    source=PaperSource.ARXIV,
-                    arxiv_id=arxiv_id,
-                    authors=authors,
-                    published_date=published_date,
-                    categories=categories,
-                    pdf_url=pdf_url,
-                )
-                papers.append(paper)
-                
-            except Exception as e:
-                print(f"Error parsing arXiv entry: {e}")
-                continue
+        authors = [
+            Author(name=_X_AUTHOR_NAME(a), affiliation=_X_AUTHOR_AFFILIATION(a) or None)
+            for a in _X_AUTHORS(entry)
+        ]
         
-        return papers
+        pdf_links = _X_PDF_LINK(entry)
+        
+        return Paper(
+            title=_clean_text(_X_TITLE(entry)),
+            abstract=_clean_text(_X_SUMMARY(entry)),
+            url=arxiv_url,
+            source=PaperSource.ARXIV,
+            arxiv_id=arxiv_id,
+            authors=authors,
+            published_date=published_date,
+            categories=_X_CATEGORIES(entry),
+            pdf_url=pdf_links[0] if pdf_links else None,
+        )
 
 
 class HuggingFaceSource(BaseSource):
@@ -159,8 +335,31 @@ class HuggingFaceSource(BaseSource):
         "https://hf-mirror.com/api/daily_papers",            # 国内镜像
     ]
     
-    def __init__(self, use_mirror: bool = True):
+    def __init__(self, use_mirror: bool = True, http_cache: Optional[HttpCache] = None):
         self.use_mirror = use_mirror
+        self.http_cache = http_cache
+    
+    async def _try_url(self, base_url: str, date: Optional[str] = None) -> Any:
+        """Fetch one mirror and return its parsed JSON, raising on any failure."""
+        url = f"{base_url}?date={date}" if date else base_url
+        timeout = aiohttp.ClientTimeout(total=30)
+        headers = dict(_HEADERS)
+        if self.http_cache:
+            headers.update(self.http_cache.conditional_headers(url))
+        session = await get_session()
+        async with session.get(url, headers=headers, timeout=timeout) as response:
+            body = None
+            if response.status == 304 and self.http_cache:
+                body = self.http_cache.load(url)
+            if body is None:
+                if response.status != 200:
+                    raise RuntimeError(f"HTTP {response.status} from {base_url}")
+                body = await response.read()
+                if self.http_cache:
+                    self.http_cache.store(url, body, response.headers)
+        data = await asyncio.to_thread(orjson.loads, body)
+        logger.info(f"      ✓ Response received from {base_url}")
+        return data
     
     async def fetch(self, date: Optional[str] = None) -> List[Paper]:
         """Fetch today's papers from HuggingFace."""
@@ -168,38 +367,39 @@ class HuggingFaceSource(BaseSource):
         
         # 选择 URL
         urls_to_try = self.API_URLS if self.use_mirror else [self.API_URLS[0]]
+        logger.info(f"      Trying: {', '.join(urls_to_try)}...")
         
+        # Race all mirrors; the first successful response wins.
         data = None
-        for base_url in urls_to_try:
-            url = base_url
-            if date:
-                url = f"{base_url}?date={date}"
-            
-            print(f"      Trying: {base_url}...")
-            
-            try:
-                timeout = aiohttp.ClientTimeout(total=30)
-                async with aiohttp.ClientSession(timeout=timeout, trust_env=True) as session:
-                    async with session.get(url) as response:
-                        if response.status != 200:
-                            print(f"      ❌ HTTP {response.status}, trying next...")
-                            continue
-                        
-                        print(f"      ✓ Response received, parsing...")
-                        data = await response.json()
-                        break  # 成功
-                        
-            except asyncio.TimeoutError:
-                print(f"      ⚠️ Timeout, trying next...")
-                continue
-            except Exception as e:
-                print(f"      ⚠️ {type(e).__name__}: {e}")
-                continue
+        pending = {asyncio.create_task(self._try_url(base_url, date)) for base_url in urls_to_try}
+        try:
+            while pending and data is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Retrieve every finished task, even after a winner, so no exception goes unobserved.
+                for task in done:
+                    exc = task.exception()
+                    if exc is None:
+                        if data is None:
+                            data = task.result()
+                    elif isinstance(exc, asyncio.TimeoutError):
+                        logger.warning(f"      ⚠️ Timeout on one mirror...")
+                    else:
+                        logger.warning(f"      ⚠️ {type(exc).__name__}: {exc}")
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
         
         if data is None:
-            print(f"      ❌ All sources failed.")
+            logger.error(f"      ❌ All sources failed.")
             return papers
         
+        # JSON -> Paper conversion is pure CPU; keep it off the event loop.
+        return await asyncio.to_thread(self._to_papers, data)
+    
+    @staticmethod
+    def _to_papers(data: Any) -> List[Paper]:
+        papers: List[Paper] = []
         for item in data:
             try:
                 paper_data = item.get("paper", {})
@@ -209,15 +409,13 @@ class HuggingFaceSource(BaseSource):
                 arxiv_url = f"https://arxiv.org/abs/{arxiv_id}" if arxiv_id else None
                 
                 # Parse authors
-                authors = []
-                for author in paper_data.get("authors", []):
-                    authors.append(Author(name=author.get("name", "")))
+                authors = [Author(name=author.get("name", "")) for author in paper_data.get("authors", [])]
                 
                 # Parse date
                 published_str = paper_data.get("publishedAt")
                 published_date = None
                 if published_str:
-                    published_date = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
+                    published_date = _parse_iso_z(published_str)
                 
                 paper = Paper(
                     title=paper_data.get("title", ""),
@@ -232,7 +430,7 @@ class HuggingFaceSource(BaseSource):
                 papers.append(paper)
                 
             except Exception as e:
-                print(f"Error parsing HuggingFace paper: {e}")
+                logger.warning(f"Error parsing HuggingFace paper: {e}")
                 continue
         
         return papers
@@ -241,6 +439,13 @@ class HuggingFaceSource(BaseSource):
 class ManualSource(BaseSource):
     """Fetch manually added papers from local JSON or D1 database."""
     
+    # Shared across instances: concurrent lookups of one arXiv ID join a single
+    # request, and resolved papers are reused for CACHE_TTL_SECONDS.
+    CACHE_TTL_SECONDS = 24 * 3600
+    ARXIV_BATCH_SIZE = 100
+    _INFLIGHT: Dict[str, "asyncio.Future[Optional[Paper]]"] = {}
+    _CACHE: Dict[str, Tuple[float, Paper]] = {}
+    
     def __init__(self, source_path: str):
         """
         source_path can be:
@@ -263,41 +468,51 @@ class ManualSource(BaseSource):
         papers = []
         
         try:
-            with open(self.source_path, "r") as f:
-                data = json.load(f)
+            with open(self.source_path, "rb") as f:
+                data = orjson.loads(f.read())
+            items = data.get("papers", [])
             
-            for item in data.get("papers", []):
-                # Support both full paper objects and simple URLs
-                if isinstance(item, str):
-                    # Just a URL - need to fetch metadata
-                    paper = await self._fetch_paper_metadata(item)
-                    if paper:
-                        papers.append(paper)
-                else:
-                    # Full paper object
-                    paper = Paper.from_dict(item)
-                    papers.append(paper)
+            # Prefetch arXiv URLs with one id_list request per batch; the
+            # per-item lookups below then resolve from the cache.
+            arxiv_ids = [self._extract_arxiv_id(item) for item in items if isinstance(item, str)]
+            await self._prefetch_arxiv_ids([arxiv_id for arxiv_id in arxiv_ids if arxiv_id])
+            
+            results = await asyncio.gather(
+                *(self._resolve_item(item) for item in items),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.warning(f"Error reading manual paper: {result}")
+                elif result:
+                    papers.append(result)
                     
         except FileNotFoundError:
-            print(f"Manual papers file not found: {self.source_path}")
+            logger.warning(f"Manual papers file not found: {self.source_path}")
         except Exception as e:
-            print(f"Error reading manual papers: {e}")
+            logger.warning(f"Error reading manual papers: {e}")
         
         return papers
     
+    async def _resolve_item(self, item: Any) -> Optional[Paper]:
+        # Support both full paper objects and simple URLs
+        if isinstance(item, str):
+            # Just a URL - need to fetch metadata
+            return await self._fetch_paper_metadata(item)
+        # Full paper object
+        return Paper.from_dict(item)
+    
     async def _fetch_from_d1(self) -> List[Paper]:
         """Fetch papers from Cloudflare D1 database."""
         # TODO: Implement D1 fetching
         # This will be used when integrating with the chatbot
-        print("D1 fetching not yet implemented")
+        logger.warning("D1 fetching not yet implemented")
         return []
     
     async def _fetch_paper_metadata(self, url: str) -> Optional[Paper]:
         """Fetch paper metadata from URL (arxiv, openreview, etc.)."""
-        # Extract arxiv ID from URL
-        arxiv_match = re.search(r"arxiv.org/(?:abs|pdf)/(\d+\.\d+)", url)
-        if arxiv_match:
-            arxiv_id = arxiv_match.group(1)
+        arxiv_id = self._extract_arxiv_id(url)
+        if arxiv_id:
             return await self._fetch_arxiv_paper(arxiv_id)
         
         # For other URLs, create a basic paper object
@@ -309,44 +524,115 @@ class ManualSource(BaseSource):
             notes="Manually added - metadata needs to be fetched",
         )
     
+    @staticmethod
+    def _extract_arxiv_id(url: str) -> Optional[str]:
+        arxiv_match = _ARXIV_URL_RE.search(url)
+        return arxiv_match.group(1) if arxiv_match else None
+    
+    async def _prefetch_arxiv_ids(self, arxiv_ids: List[str]) -> None:
+        now = time.monotonic()
+        missing = [
+            arxiv_id
+            for arxiv_id in dict.fromkeys(arxiv_ids)
+            if not (cached := self._CACHE.get(arxiv_id)) or now - cached[0] >= self.CACHE_TTL_SECONDS
+        ]
+        if not missing:
+            return
+        batches = [missing[i:i + self.ARXIV_BATCH_SIZE] for i in range(0, len(missing), self.ARXIV_BATCH_SIZE)]
+        results = await asyncio.gather(*(self._fetch_arxiv_batch(b) for b in batches), return_exceptions=True)
+        now = time.monotonic()
+        for result in results:
+            if isinstance(result, Exception):
+                # IDs left uncached fall back to single lookups.
+                logger.warning(f"Error batch-fetching arXiv papers: {result}")
+                continue
+            for arxiv_id, paper in result.items():
+                self._CACHE[arxiv_id] = (now, paper)
+    
+    async def _fetch_arxiv_batch(self, ids: List[str]) -> Dict[str, Paper]:
+        """Fetch many papers in one arXiv API call, keyed by unversioned arXiv ID."""
+        session = await get_session()
+        params = {"id_list": ",".join(ids), "max_results": len(ids)}
+        async with session.get(ArxivSource.BASE_URL, params=params, headers=_HEADERS) as response:
+            if response.status != 200:
+                raise RuntimeError(f"arXiv API error: {response.status}")
+            xml_content = await response.read()
+        
+        wanted = set(ids)
+        papers: Dict[str, Paper] = {}
+        for entry in _iter_atom_entries(xml_content):
+            arxiv_id = _ARXIV_VERSION_RE.sub("", _X_ID(entry).split("/abs/")[-1])
+            if arxiv_id in wanted:
+                papers[arxiv_id] = self._paper_from_entry(entry, arxiv_id)
+        return papers
+    
+    @staticmethod
+    def _paper_from_entry(entry: etree._Element, arxiv_id: str) -> Paper:
+        return Paper(
+            title=_clean_text(_X_TITLE(entry)),
+            abstract=_clean_text(_X_SUMMARY(entry)),
+            url=f"https://arxiv.org/abs/{arxiv_id}",
+            source=PaperSource.MANUAL,
+            arxiv_id=arxiv_id,
+            authors=[Author(name=_X_AUTHOR_NAME(a)) for a in _X_AUTHORS(entry)],
+            pdf_url=f"https://arxiv.org/pdf/{arxiv_id}.pdf",
+        )
+    
     async def _fetch_arxiv_paper(self, arxiv_id: str) -> Optional[Paper]:
-        """Fetch a single paper from arXiv by ID."""
-        url = f"http://export.arxiv.org/api/query?id_list={arxiv_id}"
+        """Fetch a single paper from arXiv by ID (cached, coalesced); returns a private copy."""
+        cached = self._CACHE.get(arxiv_id)
+        if cached and time.monotonic() - cached[0] < self.CACHE_TTL_SECONDS:
+            return copy.deepcopy(cached[1])
         
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    return None
-                xml_content = await response.text()
+        inflight = self._INFLIGHT.get(arxiv_id)
+        if inflight is not None:
+            paper = await asyncio.shield(inflight)
+            return copy.deepcopy(paper) if paper else None
         
-        root = ET.fromstring(xml_content)
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
+        future: asyncio.Future[Optional[Paper]] = asyncio.get_running_loop().create_future()
+        self._INFLIGHT[arxiv_id] = future
+        paper = None
+        try:
+            paper = await self._request_arxiv_paper(arxiv_id)
+        finally:
+            # Waiters see None on failure; the error surfaces to this caller only.
+            future.set_result(paper)
+            self._INFLIGHT.pop(arxiv_id, None)
         
-        entry = root.find("atom:entry", ns)
-        if entry is None:
+        if paper is None:
             return None
+        self._CACHE[arxiv_id] = (time.monotonic(), paper)
+        return copy.deepcopy(paper)
+    
+    async def _request_arxiv_paper(self, arxiv_id: str) -> Optional[Paper]:
+        url = f"http://export.arxiv.org/api/query?id_list={arxiv_id}"
+        
+        session = await get_session()
+        async with session.get(url, headers=_HEADERS) as response:
+            if response.status != 200:
+                return None
+            xml_content = await response.read()
         
         try:
-            authors = []
-            for author_elem in entry.findall("atom:author", ns):
-                name = author_elem.find("atom:name", ns).text
-                authors.append(Author(name=name))
-            
-            return Paper(
-                title=entry.find("atom:title", ns).text.replace("\n", " ").strip(),
-                abstract=entry.find("atom:summary", ns).text.replace("\n", " ").strip(),
-                url=f"https://arxiv.org/abs/{arxiv_id}",
-                source=PaperSource.MANUAL,
-                arxiv_id=arxiv_id,
-                authors=authors,
-                pdf_url=f"https://arxiv.org/pdf/{arxiv_id}.pdf",
-            )
+            for entry in _iter_atom_entries(xml_content):
+                return self._paper_from_entry(entry, arxiv_id)
         except Exception as e:
-            print(f"Error parsing arXiv paper {arxiv_id}: {e}")
-            return None
+            logger.warning(f"Error parsing arXiv paper {arxiv_id}: {e}")
+        return None
+
+
+def _filter_unseen(
+    memory_store: SemanticMemoryStore, ttl_days: int, papers: List[Paper]
+) -> Tuple[List[Paper], int]:
+    """Drop papers with any memory key seen within ttl_days; returns (kept, suppressed)."""
+    # Key sets live in an array parallel to papers: one memory lookup over
+    # their union, then one set-disjointness test per paper.
+    key_sets = [memory_keys_for_paper(paper) for paper in papers]
+    seen_keys = memory_store.filter_recently_seen(set().union(*key_sets), ttl_days=ttl_days)
+    kept = [paper for paper, keys in zip(papers, key_sets) if keys.isdisjoint(seen_keys)]
+    return kept, len(papers) - len(kept)
 
 
-# For future expansion
 class SemanticScholarSource(BaseSource):
     """Fetch papers from Semantic Scholar API."""
 
@@ -365,6 +651,8 @@ class SemanticScholarSource(BaseSource):
         self.max_results = max_results
         self.memory_store = memory_store
         self.seen_ttl_days = seen_ttl_days
+        # (mtime_ns, positive_ids, negative_ids) of the last seeds file read
+        self._seeds_cache: Tuple[int, List[str], List[str]] | None = None
         self.last_stats: Dict[str, int] = {
             "total": 0,
             "suppressed": 0,
@@ -372,12 +660,10 @@ class SemanticScholarSource(BaseSource):
         }
 
     async def fetch(self, **kwargs) -> List[Paper]:
-        seeds = self._load_seeds()
-        positive_ids = self._normalize_seed_ids(seeds.get("positive_paper_ids", []) or [])
-        negative_ids = self._normalize_seed_ids(seeds.get("negative_paper_ids", []) or [])
+        positive_ids, negative_ids = self._load_seeds()
 
         if not positive_ids:
-            print("      ⚠️ Semantic Scholar: no positive seed IDs found, skipping")
+            logger.warning("      ⚠️ Semantic Scholar: no positive seed IDs found, skipping")
             return []
 
         payload = {
@@ -389,7 +675,7 @@ class SemanticScholarSource(BaseSource):
             "fields": "paperId,title,abstract,authors,year,venue,url,externalIds",
         }
 
-        headers = {}
+        headers = dict(_HEADERS)
         if self.api_key:
             headers["x-api-key"] = self.api_key
 
@@ -397,63 +683,71 @@ class SemanticScholarSource(BaseSource):
         for attempt in range(max_retries):
             try:
                 timeout = aiohttp.ClientTimeout(total=40)
-                async with aiohttp.ClientSession(timeout=timeout, trust_env=True) as session:
-                    async with session.post(
-                        self.RECOMMEND_URL,
-                        headers=headers,
-                        params=params,
-                        json=payload,
-                    ) as response:
-                        if response.status in (401, 403):
-                            print(f"      ⚠️ Semantic Scholar auth error: HTTP {response.status}")
-                            return []
-                        if response.status == 429:
-                            if attempt < max_retries - 1:
-                                backoff = 2 ** (attempt + 1)
-                                print(f"      ⚠️ Semantic Scholar rate limited (429), retry in {backoff}s...")
-                                await asyncio.sleep(backoff)
-                                continue
-                            print("      ⚠️ Semantic Scholar rate limited (429), giving up")
-                            return []
-                        if response.status != 200:
-                            body = await response.text()
-                            print(f"      ⚠️ Semantic Scholar API error: HTTP {response.status} - {body[:120]}")
-                            return []
-
-                        data = await response.json()
-                        papers = self._to_papers(data)
-                        return self._apply_seen_suppression(papers)
+                session = await get_session()
+                async with session.post(
+                    self.RECOMMEND_URL,
+                    headers=headers,
+                    params=params,
+                    json=payload,
+                    timeout=timeout,
+                ) as response:
+                    if response.status in (401, 403):
+                        logger.warning(f"      ⚠️ Semantic Scholar auth error: HTTP {response.status}")
+                        return []
+                    if response.status == 429:
+                        if attempt < max_retries - 1:
+                            backoff = _retry_backoff(attempt, response.headers.get("Retry-After"))
+                            logger.warning(f"      ⚠️ Semantic Scholar rate limited (429), retry in {backoff:.1f}s...")
+                            await asyncio.sleep(backoff)
+                            continue
+                        logger.warning("      ⚠️ Semantic Scholar rate limited (429), giving up")
+                        return []
+                    if response.status != 200:
+                        body = await response.text()
+                        logger.warning(f"      ⚠️ Semantic Scholar API error: HTTP {response.status} - {body[:120]}")
+                        return []
+
+                    data = orjson.loads(await response.read())
+                    papers = self._to_papers(data)
+                    return self._apply_seen_suppression(papers)
 
             except asyncio.TimeoutError:
                 if attempt < max_retries - 1:
-                    backoff = 2 ** (attempt + 1)
-                    print(f"      ⚠️ Semantic Scholar timeout, retry in {backoff}s...")
+                    backoff = _retry_backoff(attempt)
+                    logger.warning(f"      ⚠️ Semantic Scholar timeout, retry in {backoff:.1f}s...")
                     await asyncio.sleep(backoff)
                     continue
-                print("      ⚠️ Semantic Scholar timeout, giving up")
+                logger.warning("      ⚠️ Semantic Scholar timeout, giving up")
                 return []
             except Exception as e:
                 if attempt < max_retries - 1:
-                    backoff = 2 ** (attempt + 1)
-                    print(f"      ⚠️ Semantic Scholar error ({type(e).__name__}), retry in {backoff}s...")
+                    backoff = _retry_backoff(attempt)
+                    logger.warning(f"      ⚠️ Semantic Scholar error ({type(e).__name__}), retry in {backoff:.1f}s...")
                     await asyncio.sleep(backoff)
                     continue
-                print(f"      ⚠️ Semantic Scholar error: {type(e).__name__}: {e}")
+                logger.warning(f"      ⚠️ Semantic Scholar error: {type(e).__name__}: {e}")
                 return []
 
         return []
 
-    def _load_seeds(self) -> Dict[str, Any]:
+    def _load_seeds(self) -> Tuple[List[str], List[str]]:
+        """Return normalized (positive, negative) seed IDs, re-reading only when the file changes."""
         try:
-            with open(self.seeds_path, "r") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    return data
+            st = os.stat(self.seeds_path)
+            if self._seeds_cache and self._seeds_cache[0] == st.st_mtime_ns:
+                return self._seeds_cache[1], self._seeds_cache[2]
+            with open(self.seeds_path, "rb") as f:
+                data = orjson.loads(f.read())
+            if isinstance(data, dict):
+                positive_ids = self._normalize_seed_ids(data.get("positive_paper_ids", []) or [])
+                negative_ids = self._normalize_seed_ids(data.get("negative_paper_ids", []) or [])
+                self._seeds_cache = (st.st_mtime_ns, positive_ids, negative_ids)
+                return positive_ids, negative_ids
         except FileNotFoundError:
-            print(f"      ⚠️ Semantic Scholar seeds file not found: {self.seeds_path}")
+            logger.warning(f"      ⚠️ Semantic Scholar seeds file not found: {self.seeds_path}")
         except Exception as e:
-            print(f"      ⚠️ Failed to read Semantic Scholar seeds: {e}")
-        return {"positive_paper_ids": [], "negative_paper_ids": []}
+            logger.warning(f"      ⚠️ Failed to read Semantic Scholar seeds: {e}")
+        return [], []
 
     def _normalize_seed_ids(self, ids: List[Any]) -> List[str]:
         """
@@ -482,6 +776,7 @@ class SemanticScholarSource(BaseSource):
     def _to_papers(self, data: Dict[str, Any]) -> List[Paper]:
         recs = data.get("recommendedPapers", []) if isinstance(data, dict) else []
         papers: List[Paper] = []
+        source = PaperSource.SEMANTIC_SCHOLAR
 
         for item in recs:
             try:
@@ -490,14 +785,10 @@ class SemanticScholarSource(BaseSource):
                 abstract = item.get("abstract") or ""
                 url = item.get("url") or f"https://www.semanticscholar.org/paper/{paper_id}"
 
-                authors = []
-                for a in item.get("authors", [])[:20]:
-                    name = a.get("name")
-                    if name:
-                        authors.append(Author(name=name))
+                authors = [Author(name=name) for a in item.get("authors", ())[:20] if (name := a.get("name"))]
 
-                external_ids = item.get("externalIds") or {}
-                arxiv_id = external_ids.get("ArXiv")
+                external_ids = item.get("externalIds")
+                arxiv_id = external_ids.get("ArXiv") if external_ids else None
                 pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf" if arxiv_id else None
 
                 year = item.get("year")
@@ -510,7 +801,7 @@ class SemanticScholarSource(BaseSource):
                         title=title,
                         abstract=abstract,
                         url=f"https://arxiv.org/abs/{arxiv_id}" if arxiv_id else url,
-                        source=PaperSource.SEMANTIC_SCHOLAR,
+                        source=source,
                         arxiv_id=arxiv_id,
                         authors=authors,
                         published_date=published_date,
@@ -520,7 +811,7 @@ class SemanticScholarSource(BaseSource):
                     )
                 )
             except Exception as e:
-                print(f"Error parsing Semantic Scholar paper: {e}")
+                logger.warning(f"Error parsing Semantic Scholar paper: {e}")
                 continue
 
         return papers
@@ -532,30 +823,25 @@ class SemanticScholarSource(BaseSource):
             return papers
 
         try:
-            filtered: List[Paper] = []
-            for paper in papers:
-                keys = memory_keys_for_paper(paper)
-                if keys and self.memory_store.recently_seen_any(keys, ttl_days=self.seen_ttl_days):
-                    continue
-                filtered.append(paper)
-            suppressed = total - len(filtered)
+            filtered, suppressed = _filter_unseen(self.memory_store, self.seen_ttl_days, papers)
             self.last_stats = {
                 "total": total,
                 "suppressed": suppressed,
                 "forwarded": len(filtered),
             }
-            print(
+            logger.info(
                 "      📉 Semantic Scholar suppression: "
                 f"total={total}, suppressed={suppressed}, forwarded={len(filtered)}"
             )
             return filtered
         except Exception as e:
             # Fail open so digest generation remains stable.
-            print(f"      ⚠️ Semantic Scholar suppression failed, proceeding without suppression: {e}")
+            logger.warning(f"      ⚠️ Semantic Scholar suppression failed, proceeding without suppression: {e}")
             self.last_stats = {"total": total, "suppressed": 0, "forwarded": total}
             return papers
 
 
+# For future expansion
 class OpenReviewSource(BaseSource):
     """Fetch papers from OpenReview."""
     
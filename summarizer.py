@@ -16,118 +16,22 @@ from __future__ import annotations
 import asyncio
 import base64
 import aiohttp
-from datetime import datetime
+from operator import attrgetter
+from datetime import date
+from functools import lru_cache
 from typing import Optional, List
 
 from models import Paper
 from llm_client import LLMClient
 
 
-class PaperSummarizer:
-    """Generate paper summaries and insights using any LLM."""
-    
-    def __init__(
-        self,
-        api_key: str,
-        base_url: str = "https://api.openai.com/v1",
-        model: str = "gpt-4o-mini",
-        research_interests: str = "",
-        debug_save_pdfs: bool = False,
-        debug_pdf_dir: str = "debug_pdfs",
-        pdf_max_pages: int = 10,
-    ):
-        self.client = LLMClient(
-            api_key=api_key, 
-            base_url=base_url, 
-            model=model,
-            debug_save_pdfs=debug_save_pdfs,
-            debug_pdf_dir=debug_pdf_dir,
-            pdf_max_pages=pdf_max_pages
-        )
-        self.research_interests = research_interests
-    
-    def _build_prompt(
-        self, 
-        papers: list[Paper], 
-        papers_with_pdf: list[Paper] = None, 
-        failed_pdf_papers: list[Paper] = None,
-        blog_posts: list[Paper] = None,
-    ) -> str:
-        """
-        构建 Senior Principal Researcher 视角的 prompt。
-        
-        核心理念:
-        - 不是"相关性"筛选，而是"惊奇度"和"范式转移"筛选
-        - 犀利点评，拒绝废话
-        - 中英文夹杂（专有名词英文）
-        
-        UPGRADED:
-        - 现在包含 research_notes (社区信号)
-        - NEW: 支持博客帖子（来自 priority 源）
-        - IMPROVED: 博客筛选独立于论文，只在 Blog Highlights 和 Deep Dive 中出现
-        """
-        
-        failed_pdf_set = set(failed_pdf_papers) if failed_pdf_papers else set()
-        blog_posts = blog_posts or []
-        
-        # 构建论文列表，包含 research_notes（社区信号）
-        papers_info = []
-        for i, paper in enumerate(papers, 1):
-            authors_str = ", ".join([a.name for a in paper.authors[:5]])
-            if len(paper.authors) > 5:
-                authors_str += " et al."
-            
-            has_pdf = papers_with_pdf and paper in papers_with_pdf
-            is_failed = paper in failed_pdf_set
-            
-            if is_failed:
-                pdf_note = " [⚠️ PDF失败]"
-            elif has_pdf:
-                pdf_note = " [📄 PDF]"
-            else:
-                pdf_note = ""
-            
-            # 检查是否有 research_notes（联网调研笔记）
-            community_signal = ""
-            if hasattr(paper, 'research_notes') and paper.research_notes:
-                community_signal = f"\n   🔍 Community Signals: {paper.research_notes}"
-            
-            papers_info.append(
-                f"{i}. {paper.title}{pdf_note}\n"
-                f"   Authors: {authors_str}\n"
-                f"   URL: {paper.url}"
-                f"{community_signal}"
-            )
-        
-        # 构建博客帖子列表
-        blog_info = []
-        if blog_posts:
-            for i, post in enumerate(blog_posts, 1):
-                source = getattr(post, 'blog_source', 'Unknown')
-                # 去掉标题中的 [Blog] 前缀（如果有）
-                title = post.title
-                if title.startswith("[Blog] "):
-                    title = title[7:]
-                
-                # 提供更多内容供 LLM 判断
-                content_preview = post.abstract[:500] if post.abstract else "No content preview"
-                
-                blog_info.append(
-                    f"{i}. {title}\n"
-                    f"   Source: {source}\n"
-                    f"   URL: {post.url}\n"
-                    f"   Content: {content_preview}..."
-                )
-        
-        pdf_context = ""
-        if papers_with_pdf:
-            successful_count = len(papers_with_pdf) - len(failed_pdf_set)
-            pdf_context = f"\n\n📄 {successful_count} PDFs provided for deep analysis."
-            if failed_pdf_set:
-                pdf_context += f" ({len(failed_pdf_set)} failed, using abstract only)"
-        
-        # === SYSTEM PROMPT: Senior Principal Researcher Persona ===
-        system_prompt = """You are a Senior Principal Researcher at a top-tier AI lab (OpenAI/DeepMind/Anthropic caliber), screening papers AND blog posts for your research team.
+_author_name = attrgetter("name")
+
+# Byte-stable prompt modules, concatenated in a fixed order (persona | instructions |
+# interests) so the longest possible prefix is identical from run to run and provider
+# prompt caching can hit. Nothing here may depend on the day's papers.
+PROMPT_MODULES = {
+    "persona": """You are a Senior Principal Researcher at a top-tier AI lab (OpenAI/DeepMind/Anthropic caliber), screening papers AND blog posts for your research team.
 
 ## Your Philosophy
 - You DESPISE incremental work. "Beat SOTA by 0.2%" makes you yawn.
@@ -152,34 +56,10 @@ For each paper AND blog post, you instinctively assess:
 - NOT all blog posts are worth reading!
 - Filter OUT: marketing content, product announcements, off-topic posts (health, chemical hygiene, etc.)
 - Keep ONLY: technical deep dives, year-in-review posts, research insights, methodology discussions
-- A blog post from a famous source can still be SKIP-worthy if it's not about AI research"""
+- A blog post from a famous source can still be SKIP-worthy if it's not about AI research""",
+    "task": """## Your Task
 
-        # === USER PROMPT ===
-        # Build the content sections
-        papers_section = ""
-        if papers:
-            papers_section = f"""
-## Today's Paper Pool ({len(papers)} papers)
-{chr(10).join(papers_info)}{pdf_context}
-"""
-        
-        blogs_section = ""
-        if blog_posts:
-            blogs_section = f"""
-## 📝 Blog Posts from Priority Sources ({len(blog_posts)} posts)
-**NOTE: These need filtering too! Not all are worth reading.**
-
-{chr(10).join(blog_info)}
-"""
-
-        user_prompt = f"""## My Research Interests
-{self.research_interests}
-{blogs_section}{papers_section}
----
-
-## Your Task
-
-请以 Senior Principal Researcher 的视角审阅这批内容，输出 **clean HTML**（不要 html/head/body 标签）。
+请以 Senior Principal Researcher 的视角审阅用户消息中的这批内容，输出 **clean HTML**（不要 html/head/body 标签）。
 
 **CRITICAL INSTRUCTIONS**:
 1. 博客也需要筛选！不是所有博客都值得读。过滤掉：marketing content、product announcements、与 AI 研究无关的内容。
@@ -189,11 +69,8 @@ For each paper AND blog post, you instinctively assess:
 ---
 
 ## Output Structure
-"""
-
-        # Blog section prompt (only if blogs exist)
-        if blog_posts:
-            user_prompt += """
+""",
+    "blog_sections": """
 ### Section 0: 📢 Blog Highlights (1-3 Picks)
 
 从所有博客中筛选出 **1-3 篇最值得关注的**（不要硬凑数，不足3篇也没问题）。筛选标准：
@@ -235,10 +112,8 @@ HTML 格式：
 ```
 
 ---
-"""
-
-        # Papers section prompt
-        user_prompt += """
+""",
+    "paper_sections": """
 ### Section 1: 🏆 Editor's Choice (Top 1-5 Papers)
 
 只选**真正值得读的论文**（不包含博客，1-5篇）。没有就留空，不要凑数。
@@ -363,150 +238,24 @@ HTML 格式：
 3. **Be Specific**: 不要说 "interesting"，要说具体 interesting 在哪里。
 4. **深度分析要有干货**: Key Insights 要有具体内容，不要泛泛而谈。
 5. **中英文夹杂**: 专有名词（如 diffusion, CoT, RLHF, scaling law）保留英文。
-6. **Action-oriented**: 每篇深度分析都要给出"读完后该做什么"的建议。"""
+6. **Action-oriented**: 每篇深度分析都要给出"读完后该做什么"的建议。""",
+    "interests_header": "## My Research Interests\n",
+}
+_MODULE_SEPARATOR = "\n\n---\n\n"
 
-        return {"system": system_prompt, "user": user_prompt}
-    
-    async def generate_report(
-        self, 
-        papers: list[Paper], 
-        use_pdf_multimodal: bool = True,
-        blog_posts: list[Paper] = None,
-    ) -> str:
-        """
-        Generate the daily paper digest report.
-        
-        Args:
-            papers: List of filtered papers to analyze
-            use_pdf_multimodal: Whether to use PDF multimodal input
-            blog_posts: List of priority blog posts (will be filtered by LLM)
-        
-        Returns:
-            HTML report string
-        """
-        if not papers and not blog_posts:
-            return self._wrap_html("<p>No papers or blog posts to review today.</p>", [], blog_posts)
-        
-        # Separate blog posts from papers if they're mixed together
-        actual_papers = []
-        actual_blogs = list(blog_posts) if blog_posts else []
-        
-        for paper in papers:
-            if getattr(paper, 'is_blog', False):
-                actual_blogs.append(paper)
-            else:
-                actual_papers.append(paper)
-        
-        # Remove duplicates from blogs
-        seen_urls = set()
-        unique_blogs = []
-        for blog in actual_blogs:
-            if blog.url not in seen_urls:
-                seen_urls.add(blog.url)
-                unique_blogs.append(blog)
-        actual_blogs = unique_blogs
-        
-        papers_with_pdf = []
-        failed_pdf_papers = []
-        
-        # Process PDFs for papers only (not blogs)
-        if use_pdf_multimodal and actual_papers:
-            print(f"   📄 Processing {len(actual_papers)} PDFs individually...")
-            
-            for i, paper in enumerate(actual_papers, 1):
-                print(f"      [{i}/{len(actual_papers)}] {paper.title[:40]}...")
-                if not getattr(paper, "pdf_url", None):
-                    failed_pdf_papers.append(paper)
-                    paper._pdf_base64 = None
-                    print("      ⚠️ No pdf_url, fallback to abstract-only")
-                    continue
-                pdf_content = await self.client._url_to_base64_async(
-                    paper.pdf_url,
-                    save_debug=getattr(self.client, 'debug_save_pdfs', False),
-                    debug_dir=getattr(self.client, 'debug_pdf_dir', 'debug_pdfs'),
-                    max_pages=getattr(self.client, 'pdf_max_pages', 10)
-                )
-                if pdf_content:
-                    paper._pdf_base64 = pdf_content
-                    papers_with_pdf.append(paper)
-                else:
-                    failed_pdf_papers.append(paper)
-                    paper._pdf_base64 = None
-        
-        # Build prompt
-        prompts = self._build_prompt(
-            actual_papers, 
-            papers_with_pdf, 
-            failed_pdf_papers,
-            blog_posts=actual_blogs
-        )
-        
-        # Prepare messages for LLM
-        messages = [
-            {"role": "system", "content": prompts["system"]},
-        ]
-        
-        # Build user content with PDFs
-        user_content = []
-        
-        # Add PDFs first (for papers with PDF)
-        for paper in papers_with_pdf:
-            if paper not in failed_pdf_papers and hasattr(paper, '_pdf_base64') and paper._pdf_base64:
-                user_content.append({
-                    "type": "document",
-                    "source": {
-                        "type": "base64",
-                        "media_type": "application/pdf",
-                        "data": paper._pdf_base64
-                    },
-                    "cache_control": {"type": "ephemeral"}
-                })
-        
-        # Add text prompt
-        user_content.append({
-            "type": "text",
-            "text": prompts["user"]
-        })
-        
-        messages.append({"role": "user", "content": user_content})
-        
-        # Generate report
-        try:
-            content = await self.client.achat(messages, max_tokens=8000)
-            
-            # Combine papers and blogs for the wrap
-            all_items = actual_papers + actual_blogs
-            return self._wrap_html(content, all_items, actual_blogs)
-            
-        except Exception as e:
-            error_msg = f"<p class='error'>Error generating report: {str(e)}</p>"
-            return self._wrap_html(error_msg, actual_papers, actual_blogs)
-    
-    def _wrap_html(self, content: str, papers: list[Paper], blog_posts: list[Paper] = None) -> str:
-        """Wrap content in HTML template with styling."""
-        today = datetime.now()
-        today_cn = today.strftime("%Y年%m月%d日")
-        weekdays = ["周一", "周二", "周三", "周四", "周五", "周六", "周日"]
-        weekday = weekdays[today.weekday()]
-        
-        # Count items
-        paper_count = len([p for p in papers if not getattr(p, 'is_blog', False)])
-        blog_count = len(blog_posts) if blog_posts else 0
-        
-        # Build meta string
-        if blog_count > 0 and paper_count > 0:
-            meta_str = f"{paper_count} papers + {blog_count} blogs reviewed"
-        elif blog_count > 0:
-            meta_str = f"{blog_count} blogs reviewed"
-        else:
-            meta_str = f"{paper_count} papers reviewed"
-        
-        return f"""<!DOCTYPE html>
+
+# Per-paper cap on community-signal text and the rough token budget for the
+# day's content in the user message (PDF documents are attached separately).
+_NOTES_CHAR_CAP = 800
+_USER_PROMPT_TOKEN_BUDGET = 12000
+
+# Report shell; braces in the CSS are doubled for str.format.
+_REPORT_TEMPLATE = """<!DOCTYPE html>
     <html>
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Paper Digest - {today.strftime("%Y-%m-%d")}</title>
+        <title>Paper Digest - {date}</title>
         <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
         <script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
         <style>
@@ -861,18 +610,354 @@ HTML 格式：
             </div>
             
             <div class="footer">
-                PaperFeeder · {self._get_unique_keywords(papers)}
+                PaperFeeder · {keywords}
             </div>
         </div>
     </body>
     </html>"""
+
+
+_WEEKDAYS_CN = ("周一", "周二", "周三", "周四", "周五", "周六", "周日")
+
+
+@lru_cache(maxsize=1)
+def _report_date_strings(day: date) -> tuple[str, str, str]:
+    """(ISO date, Chinese date, Chinese weekday) for the report header; formatted once per day."""
+    return day.isoformat(), day.strftime("%Y年%m月%d日"), _WEEKDAYS_CN[day.weekday()]
+
+
+class PaperSummarizer:
+    """Generate paper summaries and insights using any LLM."""
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.openai.com/v1",
+        model: str = "gpt-4o-mini",
+        research_interests: str = "",
+        debug_save_pdfs: bool = False,
+        debug_pdf_dir: str = "debug_pdfs",
+        pdf_max_pages: int = 10,
+        pdf_cache_dir: Optional[str] = None,
+        pdf_cache_ttl_days: int = 7,
+        max_concurrent_pdfs: int = 4,
+    ):
+        self.client = LLMClient(
+            api_key=api_key, 
+            base_url=base_url, 
+            model=model,
+            debug_save_pdfs=debug_save_pdfs,
+            debug_pdf_dir=debug_pdf_dir,
+            pdf_max_pages=pdf_max_pages,
+            pdf_cache_dir=pdf_cache_dir,
+            pdf_cache_ttl_days=pdf_cache_ttl_days,
+            max_concurrent_pdfs=max_concurrent_pdfs,
+        )
+        self.research_interests = research_interests
+        self._system_prompts: dict[bool, str] = {}
+    
+    async def aclose(self) -> None:
+        """Release the underlying LLM client's connections."""
+        await self.client.aclose()
+    
+    def _build_prompt(
+        self, 
+        papers: list[Paper], 
+        papers_with_pdf: list[Paper] = None, 
+        failed_pdf_papers: list[Paper] = None,
+        blog_posts: list[Paper] = None,
+    ) -> dict[str, str]:
+        """
+        构建 Senior Principal Researcher 视角的 prompt。
+        
+        Returns a dict with a byte-stable ``system`` block (cacheable across runs) and a
+        ``user`` block holding the day's blogs and papers.
+        
+        核心理念:
+        - 不是"相关性"筛选，而是"惊奇度"和"范式转移"筛选
+        - 犀利点评，拒绝废话
+        - 中英文夹杂（专有名词英文）
+        
+        UPGRADED:
+        - 现在包含 research_notes (社区信号)
+        - NEW: 支持博客帖子（来自 priority 源）
+        - IMPROVED: 博客筛选独立于论文，只在 Blog Highlights 和 Deep Dive 中出现
+        """
+        
+        failed_pdf_set = set(failed_pdf_papers) if failed_pdf_papers else set()
+        blog_posts = blog_posts or []
+        
+        # 构建论文列表，包含 research_notes（社区信号）
+        papers_info = []
+        for i, paper in enumerate(papers, 1):
+            authors_str = ", ".join(map(_author_name, paper.authors[:5]))
+            if len(paper.authors) > 5:
+                authors_str += " et al."
+            
+            has_pdf = papers_with_pdf and paper in papers_with_pdf
+            is_failed = paper in failed_pdf_set
+            
+            if is_failed:
+                pdf_note = " [⚠️ PDF失败]"
+            elif has_pdf:
+                pdf_note = " [📄 PDF]"
+            else:
+                pdf_note = ""
+            
+            # 检查是否有 research_notes（联网调研笔记）
+            community_signal = ""
+            if hasattr(paper, 'research_notes') and paper.research_notes:
+                notes = paper.research_notes
+                if len(notes) > _NOTES_CHAR_CAP:
+                    notes = notes[:_NOTES_CHAR_CAP] + "…"
+                community_signal = f"\n   🔍 Community Signals: {notes}"
+            
+            papers_info.append(
+                f"{i}. {paper.title}{pdf_note}\n"
+                f"   Authors: {authors_str}\n"
+                f"   URL: {paper.url}"
+                f"{community_signal}"
+            )
+        
+        # 构建博客帖子列表
+        # Papers always go in; blog previews fill what is left of the token budget
+        # (rough estimate: 4 chars per token).
+        blog_info = []
+        used_tokens = sum(len(info) for info in papers_info) // 4
+        omitted_blogs = 0
+        if blog_posts:
+            for i, post in enumerate(blog_posts, 1):
+                source = getattr(post, 'blog_source', 'Unknown')
+                # 去掉标题中的 [Blog] 前缀（如果有）
+                title = post.title
+                if title.startswith("[Blog] "):
+                    title = title[7:]
+                
+                # 提供更多内容供 LLM 判断
+                content_preview = post.abstract[:500] if post.abstract else "No content preview"
+                
+                entry = (
+                    f"{i}. {title}\n"
+                    f"   Source: {source}\n"
+                    f"   URL: {post.url}\n"
+                    f"   Content: {content_preview}..."
+                )
+                used_tokens += len(entry) // 4
+                if used_tokens > _USER_PROMPT_TOKEN_BUDGET:
+                    omitted_blogs = len(blog_posts) - i + 1
+                    blog_info.append(f"[{omitted_blogs} more blog posts omitted to stay within the prompt budget]")
+                    break
+                blog_info.append(entry)
+        
+        pdf_context = ""
+        if papers_with_pdf:
+            successful_count = len(papers_with_pdf) - len(failed_pdf_set)
+            pdf_context = f"\n\n📄 {successful_count} PDFs provided for deep analysis."
+            if failed_pdf_set:
+                pdf_context += f" ({len(failed_pdf_set)} failed, using abstract only)"
+        
+        # === USER PROMPT ===
+        # Only the day's content goes here; the static instructions live in the system prompt.
+        # Build the content sections
+        papers_section = ""
+        if papers:
+            papers_section = f"""
+## Today's Paper Pool ({len(papers)} papers)
+{chr(10).join(papers_info)}{pdf_context}
+"""
+        
+        blogs_section = ""
+        if blog_posts:
+            blogs_section = f"""
+## 📝 Blog Posts from Priority Sources ({len(blog_posts) - omitted_blogs} posts)
+**NOTE: These need filtering too! Not all are worth reading.**
+
+{chr(10).join(blog_info)}
+"""
+
+        user_prompt = f"{blogs_section}{papers_section}"
+        return {"system": self._system_prompt(bool(blog_posts)), "user": user_prompt}
+    
+    def _system_prompt(self, include_blogs: bool) -> str:
+        """
+        Persona, output instructions and research interests; built once per blog/no-blog variant.
+        
+        Nothing here depends on the day's papers, so the text stays byte-identical across
+        calls and provider prompt caching can reuse it.
+        """
+        cached = self._system_prompts.get(include_blogs)
+        if cached is not None:
+            return cached
+        
+        instructions = PROMPT_MODULES["task"]
+        if include_blogs:
+            instructions += PROMPT_MODULES["blog_sections"]
+        instructions += PROMPT_MODULES["paper_sections"]
+        
+        system_prompt = _MODULE_SEPARATOR.join([
+            PROMPT_MODULES["persona"].strip(),
+            instructions.strip(),
+            PROMPT_MODULES["interests_header"] + self.research_interests.strip(),
+        ])
+        self._system_prompts[include_blogs] = system_prompt
+        return system_prompt
+    
+    async def generate_report(
+        self, 
+        papers: list[Paper], 
+        use_pdf_multimodal: bool = True,
+        blog_posts: list[Paper] = None,
+    ) -> str:
+        """
+        Generate the daily paper digest report.
+        
+        Args:
+            papers: List of filtered papers to analyze
+            use_pdf_multimodal: Whether to use PDF multimodal input
+            blog_posts: List of priority blog posts (will be filtered by LLM)
+        
+        Returns:
+            HTML report string
+        """
+        if not papers and not blog_posts:
+            return self._wrap_html("<p>No papers or blog posts to review today.</p>", [], blog_posts)
+        
+        # Separate blog posts from papers if they're mixed together
+        actual_papers = []
+        actual_blogs = list(blog_posts) if blog_posts else []
+        
+        for paper in papers:
+            if getattr(paper, 'is_blog', False):
+                actual_blogs.append(paper)
+            else:
+                actual_papers.append(paper)
+        
+        # Remove duplicates from blogs
+        seen_urls = set()
+        unique_blogs = []
+        for blog in actual_blogs:
+            if blog.url not in seen_urls:
+                seen_urls.add(blog.url)
+                unique_blogs.append(blog)
+        actual_blogs = unique_blogs
+        
+        papers_with_pdf = []
+        failed_pdf_papers = []
+        
+        # Process PDFs for papers only (not blogs)
+        if use_pdf_multimodal and actual_papers:
+            print(f"   📄 Downloading {len(actual_papers)} PDFs in parallel...")
+            
+            # Start every download at once so wall time is the slowest PDF, not the sum.
+            # _url_to_base64_async returns None on failure instead of raising, so plain
+            # gather is enough (and works on the documented Python 3.10).
+            with_pdf_url = []
+            for paper in actual_papers:
+                if getattr(paper, "pdf_url", None):
+                    with_pdf_url.append(paper)
+                else:
+                    print(f"      ⚠️ No pdf_url for {paper.title[:40]}..., fallback to abstract-only")
+            results = await asyncio.gather(*(
+                self.client._url_to_base64_async(
+                    paper.pdf_url,
+                    save_debug=getattr(self.client, 'debug_save_pdfs', False),
+                    debug_dir=getattr(self.client, 'debug_pdf_dir', 'debug_pdfs'),
+                    max_pages=getattr(self.client, 'pdf_max_pages', 10)
+                )
+                for paper in with_pdf_url
+            ))
+            downloads = {id(paper): content for paper, content in zip(with_pdf_url, results)}
+            
+            # Collect in paper order so the prompt numbering stays stable.
+            for paper in actual_papers:
+                pdf_content = downloads.get(id(paper))
+                paper._pdf_base64 = pdf_content
+                if pdf_content:
+                    papers_with_pdf.append(paper)
+                else:
+                    failed_pdf_papers.append(paper)
+        
+        # Build prompt
+        prompts = self._build_prompt(
+            actual_papers, 
+            papers_with_pdf, 
+            failed_pdf_papers,
+            blog_posts=actual_blogs
+        )
+        
+        # Prepare messages for LLM
+        messages = [
+            {"role": "system", "content": prompts["system"]},
+        ]
+        
+        # Build user content with PDFs
+        user_content = []
+        
+        # Add PDFs first (for papers with PDF)
+        for paper in papers_with_pdf:
+            if paper not in failed_pdf_papers and hasattr(paper, '_pdf_base64') and paper._pdf_base64:
+                user_content.append({
+                    "type": "document",
+                    "source": {
+                        "type": "base64",
+                        "media_type": "application/pdf",
+                        "data": paper._pdf_base64
+                    },
+                })
+        
+        # One breakpoint after the last PDF caches the whole system + documents prefix
+        # (Anthropic allows at most 4 cache_control blocks per request).
+        if user_content and self.client.supports_prompt_cache():
+            user_content[-1]["cache_control"] = {"type": "ephemeral"}
+        
+        # Add text prompt
+        user_content.append({
+            "type": "text",
+            "text": prompts["user"]
+        })
+        
+        messages.append({"role": "user", "content": user_content})
+        
+        # Generate report
+        try:
+            content = await self.client.achat(messages, max_tokens=8000)
+            
+            # Combine papers and blogs for the wrap
+            all_items = actual_papers + actual_blogs
+            return self._wrap_html(content, all_items, actual_blogs)
+            
+        except Exception as e:
+            error_msg = f"<p class='error'>Error generating report: {str(e)}</p>"
+            return self._wrap_html(error_msg, actual_papers, actual_blogs)
+    
+    def _wrap_html(self, content: str, papers: list[Paper], blog_posts: list[Paper] = None) -> str:
+        """Wrap content in HTML template with styling."""
+        today_iso, today_cn, weekday = _report_date_strings(date.today())
+        
+        # Count items
+        paper_count = len([p for p in papers if not getattr(p, 'is_blog', False)])
+        blog_count = len(blog_posts) if blog_posts else 0
+        
+        # Build meta string
+        if blog_count > 0 and paper_count > 0:
+            meta_str = f"{paper_count} papers + {blog_count} blogs reviewed"
+        elif blog_count > 0:
+            meta_str = f"{blog_count} blogs reviewed"
+        else:
+            meta_str = f"{paper_count} papers reviewed"
+        
+        return _REPORT_TEMPLATE.format(
+            date=today_iso,
+            today_cn=today_cn,
+            weekday=weekday,
+            meta_str=meta_str,
+            content=content,
+            keywords=self._get_unique_keywords(papers),
+        )
     
     def _get_unique_keywords(self, papers: list[Paper]) -> str:
         """Get unique matched keywords."""
-        keywords = set()
-        for paper in papers:
-            if hasattr(paper, 'matched_keywords'):
-                keywords.update(paper.matched_keywords)
+        keywords = {kw for paper in papers for kw in (getattr(paper, 'matched_keywords', None) or ())}
         return ", ".join(sorted(keywords)[:8]) if keywords else "AI Research"
 
 
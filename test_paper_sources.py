@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Offline tests for arXiv / HuggingFace sources using recorded responses."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import orjson
+
+from models import Paper, PaperSource, dedupe_papers
+from sources.base import close_session, fetch_all, get_session
+from sources.http_cache import HttpCache
+from sources.paper_sources import ArxivSource, HuggingFaceSource
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+_NOW = datetime.now(timezone.utc)
+
+ARXIV_FEED = f"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title>ArXiv Query</title>
+  <entry>
+    <id>http://arxiv.org/abs/2501.00001v1</id>
+    <published>{_iso(_NOW - timedelta(hours=2))}</published>
+    <title>Scaling   Laws for
+      Test-Time Compute</title>
+    <summary>  We study how inference compute scales.
+    </summary>
+    <author><name>Ada Lovelace</name><arxiv:affiliation>Analytical Engines</arxiv:affiliation></author>
+    <author><name>Alan Turing</name></author>
+    <link title="pdf" href="http://arxiv.org/pdf/2501.00001v1" rel="related" type="application/pdf"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/2401.00002v2</id>
+    <published>{_iso(_NOW - timedelta(days=30))}</published>
+    <title>An Old Paper</title>
+    <summary>Too old for the window.</summary>
+    <author><name>Grace Hopper</name></author>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+</feed>
+""".encode("utf-8")
+
+HF_DAILY = orjson.dumps(
+    [
+        {
+            "paper": {
+                "id": "2501.00003",
+                "title": "Diffusion Policies",
+                "summary": "A  policy\nlearned by diffusion.",
+                "publishedAt": "2025-01-02T10:00:00.000Z",
+                "authors": [{"name": "Claude Shannon"}, {"name": "John von Neumann"}],
+            }
+        }
+    ]
+)
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes = b"", status: int = 200, headers: dict | None = None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    """Stands in for the shared aiohttp session; replays queued responses in order."""
+
+    def __init__(self, *responses: _FakeResponse):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+
+
+def _patched_session(session: _FakeSession):
+    return patch("sources.paper_sources.get_session", new=AsyncMock(return_value=session))
+
+
+class ArxivSourceTests(unittest.TestCase):
+    def test_fetch_queries_categories_in_turn_and_dedupes(self):
+        session = _FakeSession(_FakeResponse(ARXIV_FEED))
+        with _patched_session(session), patch("sources.paper_sources._ARXIV_REQUEST_INTERVAL", 0):
+            papers = asyncio.run(ArxivSource(categories=["cs.LG", "cs.AI"]).fetch(days_back=1, max_results=10))
+
+        self.assertEqual(
+            [(kwargs["params"]["search_query"], kwargs["params"]["max_results"]) for _url, kwargs in session.calls],
+            [("cat:cs.LG", 10), ("cat:cs.AI", 10)],
+        )
+        self.assertEqual(len(papers), 1)
+        paper = papers[0]
+        self.assertEqual(paper.arxiv_id, "2501.00001v1")
+        self.assertEqual(paper.title, "Scaling Laws for Test-Time Compute")
+        self.assertEqual(paper.abstract, "We study how inference compute scales.")
+        self.assertEqual([a.name for a in paper.authors], ["Ada Lovelace", "Alan Turing"])
+        self.assertEqual(paper.authors[0].affiliation, "Analytical Engines")
+        self.assertIsNone(paper.authors[1].affiliation)
+        self.assertEqual(paper.categories, ["cs.LG", "cs.AI"])
+        self.assertEqual(paper.pdf_url, "http://arxiv.org/pdf/2501.00001v1")
+        self.assertEqual(paper.source, PaperSource.ARXIV)
+
+    def test_fetch_skips_seen_ids(self):
+        session = _FakeSession(_FakeResponse(ARXIV_FEED))
+        with _patched_session(session):
+            papers = asyncio.run(
+                ArxivSource(categories=["cs.LG"]).fetch(days_back=1, seen_ids={"2501.00001v1"})
+            )
+        self.assertEqual(papers, [])
+
+    def test_not_modified_replays_cached_feed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = ArxivSource(categories=["cs.LG"], http_cache=HttpCache(tmpdir))
+            first = _FakeSession(_FakeResponse(ARXIV_FEED, headers={"ETag": '"v1"'}))
+            with _patched_session(first):
+                fresh = asyncio.run(source.fetch(days_back=1))
+
+            second = _FakeSession(_FakeResponse(status=304))
+            with _patched_session(second):
+                replayed = asyncio.run(source.fetch(days_back=1))
+
+            self.assertEqual(second.calls[0][1]["headers"].get("If-None-Match"), '"v1"')
+            self.assertEqual([p.arxiv_id for p in replayed], [p.arxiv_id for p in fresh])
+
+
+class HuggingFaceSourceTests(unittest.TestCase):
+    def test_fetch_parses_daily_papers(self):
+        session = _FakeSession(_FakeResponse(HF_DAILY))
+        with _patched_session(session):
+            papers = asyncio.run(HuggingFaceSource(use_mirror=False).fetch())
+
+        self.assertEqual(len(papers), 1)
+        paper = papers[0]
+        self.assertEqual(paper.arxiv_id, "2501.00003")
+        self.assertEqual(paper.url, "https://arxiv.org/abs/2501.00003")
+        self.assertEqual([a.name for a in paper.authors], ["Claude Shannon", "John von Neumann"])
+        self.assertEqual(paper.source, PaperSource.HUGGINGFACE)
+
+    def test_all_mirrors_failing_returns_empty(self):
+        session = _FakeSession(_FakeResponse(status=503))
+        with _patched_session(session):
+            papers = asyncio.run(HuggingFaceSource(use_mirror=True).fetch())
+        self.assertEqual(papers, [])
+
+
+class DedupePapersTests(unittest.TestCase):
+    def test_keeps_first_occurrence_by_arxiv_id_or_url(self):
+        papers = [
+            Paper("A", "", "https://arxiv.org/abs/2501.00001", PaperSource.ARXIV, arxiv_id="2501.00001"),
+            Paper("B", "", "https://example.com/b", PaperSource.MANUAL),
+            Paper("A (HF)", "", "https://huggingface.co/papers/2501.00001", PaperSource.HUGGINGFACE, arxiv_id="2501.00001"),
+            Paper("B again", "", "https://example.com/b", PaperSource.SEMANTIC_SCHOLAR),
+        ]
+        self.assertEqual([p.title for p in dedupe_papers(papers)], ["A", "B"])
+
+
+class SharedSessionTests(unittest.TestCase):
+    def test_session_from_previous_loop_is_closed_on_replacement(self):
+        first = asyncio.run(get_session())
+
+        async def second_loop():
+            try:
+                return await get_session()
+            finally:
+                await close_session()
+
+        second = asyncio.run(second_loop())
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+
+
+class FetchAllTests(unittest.TestCase):
+    def test_failed_source_yields_empty_list(self):
+        async def ok():
+            return ["paper"]
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        self.assertEqual(asyncio.run(fetch_all([ok(), broken()])), [["paper"], []])
+
+    def test_cancellation_is_not_swallowed(self):
+        async def cancelled():
+            raise asyncio.CancelledError()
+
+        with self.assertRaises(asyncio.CancelledError):
+            asyncio.run(fetch_all([cancelled()]))
+
+
+@unittest.skipUnless(os.getenv("PAPERFEEDER_NETWORK_TESTS"), "set PAPERFEEDER_NETWORK_TESTS=1 to hit live APIs")
+class LiveSourceTests(unittest.TestCase):
+    def test_live_arxiv_and_hf(self):
+        from sources import close_session
+
+        async def run():
+            try:
+                return await asyncio.gather(
+                    ArxivSource(categories=["cs.LG"]).fetch(days_back=3, max_results=20),
+                    HuggingFaceSource().fetch(),
+                )
+            finally:
+                await close_session()
+
+        arxiv_papers, hf_papers = asyncio.run(run())
+        self.assertIsInstance(arxiv_papers, list)
+        self.assertIsInstance(hf_papers, list)
+
+
+if __name__ == "__main__":
+    unittest.main()
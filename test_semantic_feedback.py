@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-import json
 import tempfile
 import unittest
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import DEFAULT, patch
+
+import orjson
 
 from models import Paper, PaperSource
 from semantic_feedback import (
+    _load_json,
     apply_feedback_d1_to_seeds,
     apply_feedback_queue_to_seeds,
     apply_feedback_to_seeds,
@@ -24,7 +27,181 @@ from semantic_feedback import (
 )
 
 
+def _json_bytes(obj) -> bytes:
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+
+# Static fixtures serialized once at import; tests write the bytes as-is.
+_MANIFEST_REVIEW = {
+    "version": "v1",
+    "run_id": "2026-02-21T08-00-00Z",
+    "generated_at": "2026-02-21T08:10:00Z",
+    "papers": [
+        {
+            "item_id": "p01",
+            "title": "A",
+            "url": "https://arxiv.org/abs/1",
+            "semantic_paper_id": "CorpusId:111",
+        },
+        {
+            "item_id": "p02",
+            "title": "B",
+            "url": "https://arxiv.org/abs/2",
+            "semantic_paper_id": "222",
+        },
+    ],
+}
+_MANIFEST_REVIEW_BYTES = _json_bytes(_MANIFEST_REVIEW)
+
+_FEEDBACK_REVIEW = {
+    "version": "v1",
+    "run_id": "2026-02-21T08-00-00Z",
+    "reviewer": "u",
+    "reviewed_at": "2026-02-21T09:00:00Z",
+    "labels": [
+        {"item_id": "p01", "label": "positive", "reviewed_at": "2026-02-21T09:01:00Z"},
+        {"item_id": "p01", "label": "negative", "reviewed_at": "2026-02-21T09:02:00Z"},
+        {"item_id": "p02", "label": "positive"},
+    ],
+}
+_FEEDBACK_REVIEW_BYTES = _json_bytes(_FEEDBACK_REVIEW)
+
+_MANIFEST_RUN1 = {
+    "version": "v1",
+    "run_id": "run-1",
+    "generated_at": "2026-02-21T08:10:00Z",
+    "papers": [
+        {"item_id": "p01", "title": "A", "url": "u1", "semantic_paper_id": "CorpusId:100"},
+        {"item_id": "p02", "title": "B", "url": "u2", "semantic_paper_id": "CorpusId:200"},
+    ],
+}
+_MANIFEST_RUN1_BYTES = _json_bytes(_MANIFEST_RUN1)
+
+_QUEUE_RUN1 = {
+    "version": "v1",
+    "events": [
+        {
+            "event_id": "evt_1",
+            "run_id": "run-1",
+            "item_id": "p01",
+            "label": "positive",
+            "reviewer": "x",
+            "created_at": "2026-02-21T10:00:00Z",
+            "source": "email_link",
+            "status": "pending",
+            "resolved_semantic_paper_id": None,
+            "applied_at": None,
+            "error": None,
+        },
+        {
+            "event_id": "evt_2",
+            "run_id": "run-1",
+            "item_id": "p01",
+            "label": "negative",
+            "reviewer": "x",
+            "created_at": "2026-02-21T10:01:00Z",
+            "source": "email_link",
+            "status": "pending",
+            "resolved_semantic_paper_id": None,
+            "applied_at": None,
+            "error": None,
+        },
+        {
+            "event_id": "evt_3",
+            "run_id": "run-1",
+            "item_id": "p02",
+            "label": "positive",
+            "reviewer": "x",
+            "created_at": "2026-02-21T10:02:00Z",
+            "source": "email_link",
+            "status": "pending",
+            "resolved_semantic_paper_id": None,
+            "applied_at": None,
+            "error": None,
+        },
+    ],
+}
+_QUEUE_RUN1_BYTES = _json_bytes(_QUEUE_RUN1)
+
+_PARITY_EVENTS = [
+    {
+        "event_id": "evt_1",
+        "run_id": "run-1",
+        "item_id": "p01",
+        "label": "positive",
+        "reviewer": "x",
+        "created_at": "2026-02-21T10:00:00Z",
+        "source": "email_link",
+        "status": "pending",
+        "resolved_semantic_paper_id": "CorpusId:100",
+        "applied_at": None,
+        "error": None,
+    },
+    {
+        "event_id": "evt_2",
+        "run_id": "run-1",
+        "item_id": "p01",
+        "label": "negative",
+        "reviewer": "x",
+        "created_at": "2026-02-21T10:01:00Z",
+        "source": "email_link",
+        "status": "pending",
+        "resolved_semantic_paper_id": "CorpusId:100",
+        "applied_at": None,
+        "error": None,
+    },
+    {
+        "event_id": "evt_3",
+        "run_id": "run-1",
+        "item_id": "p02",
+        "label": "positive",
+        "reviewer": "x",
+        "created_at": "2026-02-21T10:02:00Z",
+        "source": "email_link",
+        "status": "pending",
+        "resolved_semantic_paper_id": "CorpusId:200",
+        "applied_at": None,
+        "error": None,
+    },
+]
+_PARITY_QUEUE_BYTES = _json_bytes({"version": "v1", "events": _PARITY_EVENTS})
+
+
+@lru_cache(maxsize=64)
+def _sign_canonical(claims_json: bytes, secret: str) -> str:
+    return create_feedback_token(orjson.loads(claims_json), secret)
+
+
+def _signed(claims: dict, secret: str) -> str:
+    """Sign once per distinct claim set; verification stays uncached."""
+    return _sign_canonical(orjson.dumps(claims, option=orjson.OPT_SORT_KEYS), secret)
+
+
 class SemanticFeedbackTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Read-only fixtures shared across tests; tests that write seeds/queues use their own dir.
+        cls._tdir = tempfile.TemporaryDirectory()
+        cls._base = Path(cls._tdir.name)
+        (cls._base / "manifest_run_a.json").write_bytes(
+            _json_bytes({"version": "v1", "run_id": "run-a", "generated_at": "2026-02-21T08:10:00Z", "papers": []})
+        )
+        (cls._base / "feedback_run_b.json").write_bytes(
+            _json_bytes(
+                {
+                    "version": "v1",
+                    "run_id": "run-b",
+                    "reviewer": "u",
+                    "reviewed_at": "2026-02-21T09:00:00Z",
+                    "labels": [],
+                }
+            )
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tdir.cleanup()
+
     def test_export_manifest_contains_report_visible_entries(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             papers = [
@@ -48,8 +225,8 @@ class SemanticFeedbackTests(unittest.TestCase):
 
             self.assertIsNotNone(out)
             manifest_path, questionnaire_path = out
-            data = json.loads(Path(manifest_path).read_text())
-            questionnaire = json.loads(Path(questionnaire_path).read_text())
+            data = orjson.loads(Path(manifest_path).read_bytes())
+            questionnaire = orjson.loads(Path(questionnaire_path).read_bytes())
             self.assertEqual(data["run_id"], "2026-02-21T08-00-00Z")
             self.assertEqual(len(data["papers"]), 1)
             self.assertEqual(data["papers"][0]["item_id"], "p01")
@@ -65,54 +242,15 @@ class SemanticFeedbackTests(unittest.TestCase):
             feedback = td_path / "feedback.json"
             seeds = td_path / "seeds.json"
 
-            manifest.write_text(
-                json.dumps(
-                    {
-                        "version": "v1",
-                        "run_id": "2026-02-21T08-00-00Z",
-                        "generated_at": "2026-02-21T08:10:00Z",
-                        "papers": [
-                            {
-                                "item_id": "p01",
-                                "title": "A",
-                                "url": "https://arxiv.org/abs/1",
-                                "semantic_paper_id": "CorpusId:111",
-                            },
-                            {
-                                "item_id": "p02",
-                                "title": "B",
-                                "url": "https://arxiv.org/abs/2",
-                                "semantic_paper_id": "222",
-                            },
-                        ],
-                    }
-                )
-                + "\n"
-            )
-            feedback.write_text(
-                json.dumps(
-                    {
-                        "version": "v1",
-                        "run_id": "2026-02-21T08-00-00Z",
-                        "reviewer": "u",
-                        "reviewed_at": "2026-02-21T09:00:00Z",
-                        "labels": [
-                            {"item_id": "p01", "label": "positive", "reviewed_at": "2026-02-21T09:01:00Z"},
-                            {"item_id": "p01", "label": "negative", "reviewed_at": "2026-02-21T09:02:00Z"},
-                            {"item_id": "p02", "label": "positive"},
-                        ],
-                    }
-                )
-                + "\n"
-            )
-            seeds.write_text(
-                json.dumps(
+            manifest.write_bytes(_MANIFEST_REVIEW_BYTES)
+            feedback.write_bytes(_FEEDBACK_REVIEW_BYTES)
+            seeds.write_bytes(
+                _json_bytes(
                     {
                         "positive_paper_ids": ["CorpusId:111"],
                         "negative_paper_ids": [],
                     }
                 )
-                + "\n"
             )
 
             result = apply_feedback_to_seeds(
@@ -123,7 +261,7 @@ class SemanticFeedbackTests(unittest.TestCase):
             )
             self.assertEqual(result["applied_count"], 2)
 
-            updated = json.loads(seeds.read_text())
+            updated = orjson.loads(seeds.read_bytes())
             self.assertEqual(updated["positive_paper_ids"], ["CorpusId:222"])
             self.assertEqual(updated["negative_paper_ids"], ["CorpusId:111"])
 
@@ -134,8 +272,8 @@ class SemanticFeedbackTests(unittest.TestCase):
             feedback = td_path / "feedback.json"
             seeds = td_path / "seeds.json"
 
-            manifest.write_text(
-                json.dumps(
+            manifest.write_bytes(
+                _json_bytes(
                     {
                         "version": "v1",
                         "run_id": "run-reset",
@@ -150,10 +288,9 @@ class SemanticFeedbackTests(unittest.TestCase):
                         ],
                     }
                 )
-                + "\n"
             )
-            feedback.write_text(
-                json.dumps(
+            feedback.write_bytes(
+                _json_bytes(
                     {
                         "version": "v1",
                         "run_id": "run-reset",
@@ -164,16 +301,14 @@ class SemanticFeedbackTests(unittest.TestCase):
                         ],
                     }
                 )
-                + "\n"
             )
-            seeds.write_text(
-                json.dumps(
+            seeds.write_bytes(
+                _json_bytes(
                     {
                         "positive_paper_ids": ["CorpusId:111"],
                         "negative_paper_ids": [],
                     }
                 )
-                + "\n"
             )
 
             result = apply_feedback_to_seeds(
@@ -183,47 +318,23 @@ class SemanticFeedbackTests(unittest.TestCase):
                 dry_run=False,
             )
             self.assertEqual(result["applied_count"], 1)
-            updated = json.loads(seeds.read_text())
+            updated = orjson.loads(seeds.read_bytes())
             self.assertEqual(updated["positive_paper_ids"], [])
             self.assertEqual(updated["negative_paper_ids"], [])
 
     def test_apply_feedback_rejects_run_id_mismatch(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            td_path = Path(td)
-            manifest = td_path / "manifest.json"
-            feedback = td_path / "feedback.json"
-
-            manifest.write_text(
-                json.dumps(
-                    {
-                        "version": "v1",
-                        "run_id": "run-a",
-                        "generated_at": "2026-02-21T08:10:00Z",
-                        "papers": [],
-                    }
-                )
-                + "\n"
-            )
-            feedback.write_text(
-                json.dumps(
-                    {
-                        "version": "v1",
-                        "run_id": "run-b",
-                        "reviewer": "u",
-                        "reviewed_at": "2026-02-21T09:00:00Z",
-                        "labels": [],
-                    }
-                )
-                + "\n"
+        with self.assertRaises(ValueError):
+            apply_feedback_to_seeds(
+                feedback_path=str(self._base / "feedback_run_b.json"),
+                manifest_path=str(self._base / "manifest_run_a.json"),
+                seeds_path=str(self._base / "seeds.json"),
+                dry_run=True,
             )
 
-            with self.assertRaises(ValueError):
-                apply_feedback_to_seeds(
-                    feedback_path=str(feedback),
-                    manifest_path=str(manifest),
-                    seeds_path=str(td_path / "seeds.json"),
-                    dry_run=True,
-                )
+    def test_load_json_memory_maps_large_files(self) -> None:
+        path = self._base / "manifest_run_a.json"
+        with patch("semantic_feedback._MMAP_MIN_BYTES", 0):
+            self.assertEqual(_load_json(str(path)), orjson.loads(path.read_bytes()))
 
     def test_token_sign_and_verify(self) -> None:
         claims = {
@@ -234,7 +345,7 @@ class SemanticFeedbackTests(unittest.TestCase):
             "reviewer": "xuhan",
             "exp": "2099-01-01T00:00:00Z",
         }
-        token = create_feedback_token(claims, "secret123")
+        token = _signed(claims, "secret123")
         verified = verify_feedback_token(token, "secret123")
         self.assertEqual(verified["run_id"], "run-1")
         self.assertEqual(verified["item_id"], "p01")
@@ -252,7 +363,7 @@ class SemanticFeedbackTests(unittest.TestCase):
                 "reviewer": "xuhan",
                 "exp": "2099-01-01T00:00:00Z",
             }
-            token = create_feedback_token(claims, "secret123")
+            token = _signed(claims, "secret123")
             event = ingest_feedback_token(
                 token=token,
                 signing_secret="secret123",
@@ -263,7 +374,7 @@ class SemanticFeedbackTests(unittest.TestCase):
             self.assertEqual(event["item_id"], "p02")
             self.assertEqual(event["label"], "negative")
             self.assertEqual(event["resolved_semantic_paper_id"], "CorpusId:123")
-            queue_data = json.loads(Path(queue_path).read_text())
+            queue_data = orjson.loads(Path(queue_path).read_bytes())
             self.assertEqual(len(queue_data["events"]), 1)
             self.assertEqual(queue_data["events"][0]["status"], "pending")
 
@@ -276,10 +387,23 @@ class SemanticFeedbackTests(unittest.TestCase):
             "reviewer": "xuhan",
             "exp": "2000-01-01T00:00:00Z",
         }
-        token = create_feedback_token(claims, "secret123")
-        with self.assertRaises(ValueError):
+        token = _signed(claims, "secret123")
+        with self.assertRaisesRegex(ValueError, "expired token"):
             ingest_feedback_token(token=token, signing_secret="secret123", queue_path=":memory:")
 
+    def test_verify_rejects_tampered_token(self) -> None:
+        claims = {
+            "v": 1,
+            "run_id": "run-1",
+            "item_id": "p01",
+            "label": "positive",
+            "reviewer": "xuhan",
+            "exp": "2099-01-01T00:00:00Z",
+        }
+        token = _signed(claims, "secret123")
+        with self.assertRaisesRegex(ValueError, "invalid token signature"):
+            verify_feedback_token(token, "other-secret")
+
     def test_apply_queue_latest_event_wins(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             td_path = Path(td)
@@ -287,70 +411,9 @@ class SemanticFeedbackTests(unittest.TestCase):
             queue = td_path / "queue.json"
             seeds = td_path / "seeds.json"
 
-            manifest.write_text(
-                json.dumps(
-                    {
-                        "version": "v1",
-                        "run_id": "run-1",
-                        "generated_at": "2026-02-21T08:10:00Z",
-                        "papers": [
-                            {"item_id": "p01", "title": "A", "url": "u1", "semantic_paper_id": "CorpusId:100"},
-                            {"item_id": "p02", "title": "B", "url": "u2", "semantic_paper_id": "CorpusId:200"},
-                        ],
-                    }
-                )
-                + "\n"
-            )
-            queue.write_text(
-                json.dumps(
-                    {
-                        "version": "v1",
-                        "events": [
-                            {
-                                "event_id": "evt_1",
-                                "run_id": "run-1",
-                                "item_id": "p01",
-                                "label": "positive",
-                                "reviewer": "x",
-                                "created_at": "2026-02-21T10:00:00Z",
-                                "source": "email_link",
-                                "status": "pending",
-                                "resolved_semantic_paper_id": None,
-                                "applied_at": None,
-                                "error": None,
-                            },
-                            {
-                                "event_id": "evt_2",
-                                "run_id": "run-1",
-                                "item_id": "p01",
-                                "label": "negative",
-                                "reviewer": "x",
-                                "created_at": "2026-02-21T10:01:00Z",
-                                "source": "email_link",
-                                "status": "pending",
-                                "resolved_semantic_paper_id": None,
-                                "applied_at": None,
-                                "error": None,
-                            },
-                            {
-                                "event_id": "evt_3",
-                                "run_id": "run-1",
-                                "item_id": "p02",
-                                "label": "positive",
-                                "reviewer": "x",
-                                "created_at": "2026-02-21T10:02:00Z",
-                                "source": "email_link",
-                                "status": "pending",
-                                "resolved_semantic_paper_id": None,
-                                "applied_at": None,
-                                "error": None,
-                            },
-                        ],
-                    }
-                )
-                + "\n"
-            )
-            seeds.write_text(json.dumps({"positive_paper_ids": [], "negative_paper_ids": []}) + "\n")
+            manifest.write_bytes(_MANIFEST_RUN1_BYTES)
+            queue.write_bytes(_QUEUE_RUN1_BYTES)
+            seeds.write_bytes(_json_bytes({"positive_paper_ids": [], "negative_paper_ids": []}))
 
             result = apply_feedback_queue_to_seeds(
                 manifest_path=str(manifest),
@@ -360,7 +423,7 @@ class SemanticFeedbackTests(unittest.TestCase):
             )
             self.assertEqual(result["applied_count"], 2)
             self.assertGreaterEqual(result["rejected_count"], 1)
-            updated_seeds = json.loads(seeds.read_text())
+            updated_seeds = orjson.loads(seeds.read_bytes())
             self.assertIn("CorpusId:200", updated_seeds["positive_paper_ids"])
             self.assertIn("CorpusId:100", updated_seeds["negative_paper_ids"])
 
@@ -371,8 +434,8 @@ class SemanticFeedbackTests(unittest.TestCase):
             queue = td_path / "queue.json"
             seeds = td_path / "seeds.json"
 
-            manifest.write_text(
-                json.dumps(
+            manifest.write_bytes(
+                _json_bytes(
                     {
                         "version": "v1",
                         "run_id": "run-1",
@@ -382,10 +445,9 @@ class SemanticFeedbackTests(unittest.TestCase):
                         ],
                     }
                 )
-                + "\n"
             )
-            queue.write_text(
-                json.dumps(
+            queue.write_bytes(
+                _json_bytes(
                     {
                         "version": "v1",
                         "events": [
@@ -405,10 +467,9 @@ class SemanticFeedbackTests(unittest.TestCase):
                         ],
                     }
                 )
-                + "\n"
             )
-            seeds.write_text(
-                json.dumps({"positive_paper_ids": ["CorpusId:100"], "negative_paper_ids": []}) + "\n"
+            seeds.write_bytes(
+                _json_bytes({"positive_paper_ids": ["CorpusId:100"], "negative_paper_ids": []})
             )
 
             result = apply_feedback_queue_to_seeds(
@@ -418,7 +479,7 @@ class SemanticFeedbackTests(unittest.TestCase):
                 dry_run=False,
             )
             self.assertEqual(result["applied_count"], 1)
-            updated = json.loads(seeds.read_text())
+            updated = orjson.loads(seeds.read_bytes())
             self.assertEqual(updated["positive_paper_ids"], [])
             self.assertEqual(updated["negative_paper_ids"], [])
 
@@ -483,7 +544,7 @@ class SemanticFeedbackTests(unittest.TestCase):
             )
             self.assertIsNotNone(out)
             manifest_path, _ = out
-            manifest = json.loads(Path(manifest_path).read_text())
+            manifest = orjson.loads(Path(manifest_path).read_bytes())
             self.assertEqual(len(manifest["papers"]), 1)
             self.assertNotIn("action_links", manifest["papers"][0])
             updated = inject_feedback_actions_into_report(html, str(manifest_path))
@@ -570,8 +631,8 @@ class SemanticFeedbackTests(unittest.TestCase):
 
             self.assertIsNotNone(out)
             manifest_path, questionnaire_path = out
-            manifest = json.loads(Path(manifest_path).read_text())
-            questionnaire = json.loads(Path(questionnaire_path).read_text())
+            manifest = orjson.loads(Path(manifest_path).read_bytes())
+            questionnaire = orjson.loads(Path(questionnaire_path).read_bytes())
             self.assertEqual(len(manifest["papers"]), 2)
             first = manifest["papers"][0]
             second = manifest["papers"][1]
@@ -712,19 +773,27 @@ class SemanticFeedbackTests(unittest.TestCase):
                 )
             self.assertIsNotNone(out)
             manifest_path, _ = out
-            manifest = json.loads(Path(manifest_path).read_text())
+            manifest = orjson.loads(Path(manifest_path).read_bytes())
             self.assertEqual(len(manifest["papers"]), 2)
             self.assertFalse(manifest["papers"][1]["feedback_enabled"])
             self.assertEqual(manifest["papers"][1]["resolution_status"], "error")
             self.assertEqual(manifest["papers"][1]["resolution_error"], "budget_exhausted")
 
-    @patch("semantic_feedback._d1_execute")
-    def test_publish_feedback_run_to_d1(self, mock_d1_execute) -> None:
+
+class SemanticFeedbackD1Tests(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = patch.multiple("semantic_feedback", _d1_query=DEFAULT, _d1_execute=DEFAULT)
+        mocks = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_d1_query = mocks["_d1_query"]
+        self.mock_d1_execute = mocks["_d1_execute"]
+
+    def test_publish_feedback_run_to_d1(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             td_path = Path(td)
             manifest = td_path / "manifest.json"
-            manifest.write_text(
-                json.dumps(
+            manifest.write_bytes(
+                _json_bytes(
                     {
                         "version": "v1",
                         "run_id": "run-pub",
@@ -732,77 +801,89 @@ class SemanticFeedbackTests(unittest.TestCase):
                         "papers": [],
                     }
                 )
-                + "\n"
             )
             run_id = publish_feedback_run_to_d1(
                 manifest_path=str(manifest),
-                report_html="<html>r</html>",
+                report_html="<html>it's</html>",
                 account_id="acc",
                 api_token="tok",
                 database_id="db",
             )
             self.assertEqual(run_id, "run-pub")
-            self.assertGreaterEqual(mock_d1_execute.call_count, 2)
+            self.assertGreaterEqual(self.mock_d1_execute.call_count, 2)
+            upsert_args = self.mock_d1_execute.call_args.args
+            self.assertNotIn("it's", upsert_args[3])
+            self.assertEqual(upsert_args[4][0], "run-pub")
+            self.assertEqual(upsert_args[4][2], "<html>it's</html>")
             self.assertEqual(get_run_id_from_manifest(str(manifest)), "run-pub")
 
-    @patch("semantic_feedback._d1_execute")
-    @patch("semantic_feedback._d1_query")
-    def test_apply_d1_all_pending_default(self, mock_d1_query, _mock_d1_execute) -> None:
+    def test_apply_d1_dry_run_matrix(self) -> None:
+        """All pending events across runs are applied; only dry_run=False writes seeds or D1."""
+        events = [
+            {
+                "event_id": "evt_1",
+                "run_id": "run-a",
+                "item_id": "p01",
+                "label": "positive",
+                "reviewer": "x",
+                "created_at": "2026-02-21T10:00:00Z",
+                "source": "email_link",
+                "status": "pending",
+                "resolved_semantic_paper_id": "CorpusId:100",
+                "applied_at": None,
+                "error": None,
+            },
+            {
+                "event_id": "evt_2",
+                "run_id": "run-b",
+                "item_id": "p03",
+                "label": "negative",
+                "reviewer": "x",
+                "created_at": "2026-02-21T10:01:00Z",
+                "source": "email_link",
+                "status": "pending",
+                "resolved_semantic_paper_id": "CorpusId:200",
+                "applied_at": None,
+                "error": None,
+            },
+        ]
+        initial = {"positive_paper_ids": [], "negative_paper_ids": []}
         with tempfile.TemporaryDirectory() as td:
             td_path = Path(td)
             seeds = td_path / "seeds.json"
-            seeds.write_text(json.dumps({"positive_paper_ids": [], "negative_paper_ids": []}) + "\n")
-
-            mock_d1_query.return_value = [
-                {
-                    "event_id": "evt_1",
-                    "run_id": "run-a",
-                    "item_id": "p01",
-                    "label": "positive",
-                    "reviewer": "x",
-                    "created_at": "2026-02-21T10:00:00Z",
-                    "source": "email_link",
-                    "status": "pending",
-                    "resolved_semantic_paper_id": "CorpusId:100",
-                    "applied_at": None,
-                    "error": None,
-                },
-                {
-                    "event_id": "evt_2",
-                    "run_id": "run-b",
-                    "item_id": "p03",
-                    "label": "negative",
-                    "reviewer": "x",
-                    "created_at": "2026-02-21T10:01:00Z",
-                    "source": "email_link",
-                    "status": "pending",
-                    "resolved_semantic_paper_id": "CorpusId:200",
-                    "applied_at": None,
-                    "error": None,
-                },
-            ]
-
-            result = apply_feedback_d1_to_seeds(
-                seeds_path=str(seeds),
-                dry_run=True,
-                account_id="acc",
-                api_token="tok",
-                database_id="db",
-                manifests_dir=str(td_path / "missing-artifacts"),
-            )
-            self.assertEqual(result["mode"], "d1")
-            self.assertEqual(result["d1_pending_count"], 2)
-            self.assertEqual(result["applied_count"], 2)
-
-    @patch("semantic_feedback._d1_execute")
-    @patch("semantic_feedback._d1_query")
-    def test_apply_d1_undecided_resets_seed_membership(self, mock_d1_query, _mock_d1_execute) -> None:
+            for dry_run in (True, False):
+                with self.subTest(dry_run=dry_run):
+                    seeds.write_bytes(_json_bytes(initial))
+                    self.mock_d1_execute.reset_mock()
+                    self.mock_d1_query.return_value = events
+
+                    result = apply_feedback_d1_to_seeds(
+                        seeds_path=str(seeds),
+                        dry_run=dry_run,
+                        account_id="acc",
+                        api_token="tok",
+                        database_id="db",
+                        manifests_dir=str(td_path / "missing-artifacts"),
+                    )
+                    self.assertEqual(result["mode"], "d1")
+                    self.assertEqual(result["d1_pending_count"], 2)
+                    self.assertEqual(result["applied_count"], 2)
+                    if dry_run:
+                        self.assertEqual(orjson.loads(seeds.read_bytes()), initial)
+                        self.mock_d1_execute.assert_not_called()
+                    else:
+                        updated = orjson.loads(seeds.read_bytes())
+                        self.assertEqual(updated["positive_paper_ids"], ["CorpusId:100"])
+                        self.assertEqual(updated["negative_paper_ids"], ["CorpusId:200"])
+                        self.assertEqual(self.mock_d1_execute.call_count, 2)
+
+    def test_apply_d1_undecided_resets_seed_membership(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             td_path = Path(td)
             seeds = td_path / "seeds.json"
-            seeds.write_text(json.dumps({"positive_paper_ids": ["CorpusId:100"], "negative_paper_ids": []}) + "\n")
+            seeds.write_bytes(_json_bytes({"positive_paper_ids": ["CorpusId:100"], "negative_paper_ids": []}))
 
-            mock_d1_query.return_value = [
+            self.mock_d1_query.return_value = [
                 {
                     "event_id": "evt_1",
                     "run_id": "run-a",
@@ -827,19 +908,18 @@ class SemanticFeedbackTests(unittest.TestCase):
                 manifests_dir=str(td_path / "missing-artifacts"),
             )
             self.assertEqual(result["applied_count"], 1)
-            updated = json.loads(seeds.read_text())
+            updated = orjson.loads(seeds.read_bytes())
             self.assertEqual(updated["positive_paper_ids"], [])
             self.assertEqual(updated["negative_paper_ids"], [])
 
-    @patch("semantic_feedback._d1_query")
-    def test_apply_d1_failure_does_not_write_seeds(self, mock_d1_query) -> None:
+    def test_apply_d1_failure_does_not_write_seeds(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             td_path = Path(td)
             seeds = td_path / "seeds.json"
             initial = {"positive_paper_ids": ["CorpusId:1"], "negative_paper_ids": []}
-            seeds.write_text(json.dumps(initial) + "\n")
+            seeds.write_bytes(_json_bytes(initial))
 
-            mock_d1_query.side_effect = RuntimeError("boom")
+            self.mock_d1_query.side_effect = RuntimeError("boom")
 
             with self.assertRaises(RuntimeError):
                 apply_feedback_d1_to_seeds(
@@ -849,47 +929,9 @@ class SemanticFeedbackTests(unittest.TestCase):
                     api_token="tok",
                     database_id="db",
                 )
-            self.assertEqual(json.loads(seeds.read_text()), initial)
-
-    @patch("semantic_feedback._d1_execute")
-    @patch("semantic_feedback._d1_query")
-    def test_apply_d1_dry_run_has_no_side_effects(self, mock_d1_query, mock_d1_execute) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            td_path = Path(td)
-            seeds = td_path / "seeds.json"
-            initial = {"positive_paper_ids": [], "negative_paper_ids": []}
-            seeds.write_text(json.dumps(initial) + "\n")
-            mock_d1_query.return_value = [
-                {
-                    "event_id": "evt_1",
-                    "run_id": "run-a",
-                    "item_id": "p01",
-                    "label": "positive",
-                    "reviewer": "x",
-                    "created_at": "2026-02-21T10:00:00Z",
-                    "source": "email_link",
-                    "status": "pending",
-                    "resolved_semantic_paper_id": "CorpusId:100",
-                    "applied_at": None,
-                    "error": None,
-                }
-            ]
+            self.assertEqual(orjson.loads(seeds.read_bytes()), initial)
 
-            result = apply_feedback_d1_to_seeds(
-                seeds_path=str(seeds),
-                dry_run=True,
-                account_id="acc",
-                api_token="tok",
-                database_id="db",
-                manifests_dir=str(td_path / "missing-artifacts"),
-            )
-            self.assertEqual(result["applied_count"], 1)
-            self.assertEqual(json.loads(seeds.read_text()), initial)
-            mock_d1_execute.assert_not_called()
-
-    @patch("semantic_feedback._d1_execute")
-    @patch("semantic_feedback._d1_query")
-    def test_apply_d1_and_queue_modes_have_parity(self, mock_d1_query, _mock_d1_execute) -> None:
+    def test_apply_d1_and_queue_modes_have_parity(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             td_path = Path(td)
             manifest = td_path / "manifest.json"
@@ -897,66 +939,12 @@ class SemanticFeedbackTests(unittest.TestCase):
             queue_seeds = td_path / "queue_seeds.json"
             d1_seeds = td_path / "d1_seeds.json"
 
-            manifest.write_text(
-                json.dumps(
-                    {
-                        "version": "v1",
-                        "run_id": "run-1",
-                        "generated_at": "2026-02-21T08:10:00Z",
-                        "papers": [
-                            {"item_id": "p01", "title": "A", "url": "u1", "semantic_paper_id": "CorpusId:100"},
-                            {"item_id": "p02", "title": "B", "url": "u2", "semantic_paper_id": "CorpusId:200"},
-                        ],
-                    }
-                )
-                + "\n"
-            )
-            events = [
-                {
-                    "event_id": "evt_1",
-                    "run_id": "run-1",
-                    "item_id": "p01",
-                    "label": "positive",
-                    "reviewer": "x",
-                    "created_at": "2026-02-21T10:00:00Z",
-                    "source": "email_link",
-                    "status": "pending",
-                    "resolved_semantic_paper_id": "CorpusId:100",
-                    "applied_at": None,
-                    "error": None,
-                },
-                {
-                    "event_id": "evt_2",
-                    "run_id": "run-1",
-                    "item_id": "p01",
-                    "label": "negative",
-                    "reviewer": "x",
-                    "created_at": "2026-02-21T10:01:00Z",
-                    "source": "email_link",
-                    "status": "pending",
-                    "resolved_semantic_paper_id": "CorpusId:100",
-                    "applied_at": None,
-                    "error": None,
-                },
-                {
-                    "event_id": "evt_3",
-                    "run_id": "run-1",
-                    "item_id": "p02",
-                    "label": "positive",
-                    "reviewer": "x",
-                    "created_at": "2026-02-21T10:02:00Z",
-                    "source": "email_link",
-                    "status": "pending",
-                    "resolved_semantic_paper_id": "CorpusId:200",
-                    "applied_at": None,
-                    "error": None,
-                },
-            ]
-            queue.write_text(json.dumps({"version": "v1", "events": events}, indent=2) + "\n")
+            manifest.write_bytes(_MANIFEST_RUN1_BYTES)
+            queue.write_bytes(_PARITY_QUEUE_BYTES)
 
             initial = {"positive_paper_ids": [], "negative_paper_ids": []}
-            queue_seeds.write_text(json.dumps(initial) + "\n")
-            d1_seeds.write_text(json.dumps(initial) + "\n")
+            queue_seeds.write_bytes(_json_bytes(initial))
+            d1_seeds.write_bytes(_json_bytes(initial))
 
             queue_result = apply_feedback_queue_to_seeds(
                 manifest_path=str(manifest),
@@ -965,7 +953,7 @@ class SemanticFeedbackTests(unittest.TestCase):
                 dry_run=False,
             )
 
-            mock_d1_query.return_value = events
+            self.mock_d1_query.return_value = _PARITY_EVENTS
             d1_result = apply_feedback_d1_to_seeds(
                 seeds_path=str(d1_seeds),
                 dry_run=False,
@@ -976,7 +964,7 @@ class SemanticFeedbackTests(unittest.TestCase):
                 database_id="db",
             )
 
-            self.assertEqual(json.loads(queue_seeds.read_text()), json.loads(d1_seeds.read_text()))
+            self.assertEqual(orjson.loads(queue_seeds.read_bytes()), orjson.loads(d1_seeds.read_bytes()))
             self.assertEqual(queue_result["applied_count"], d1_result["applied_count"])
             self.assertEqual(queue_result["rejected_count"], d1_result["rejected_count"])
 
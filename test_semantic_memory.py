@@ -3,13 +3,15 @@
 
 from __future__ import annotations
 
-import json
+import os
 import tempfile
 import unittest
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from types import SimpleNamespace
 
+import orjson
+
 from models import Paper, PaperSource
 from main import _extract_report_urls, _normalize_url_for_match, update_semantic_memory_from_report
 from semantic_memory import (
@@ -18,7 +20,7 @@ from semantic_memory import (
     normalize_arxiv_id,
     normalize_semantic_id,
 )
-from sources.paper_sources import SemanticScholarSource
+from sources.paper_sources import SemanticScholarSource, _filter_unseen
 
 
 class MemoryKeyHelpersTests(unittest.TestCase):
@@ -62,12 +64,18 @@ class SemanticMemoryStoreTests(unittest.TestCase):
             store.mark_seen(["p1", "p2"])
             self.assertTrue(store.recently_seen("p1", ttl_days=30))
             self.assertEqual(store.filter_recently_seen(["p1", "pX"], ttl_days=30), {"p1"})
+            store.mark_seen(["pX"])
+            self.assertEqual(store.filter_recently_seen(["p1", "pX"], ttl_days=30), {"p1", "pX"})
+            self.assertTrue(store.recently_seen_any(["pY", "p1"], ttl_days=30))
+            self.assertFalse(store.recently_seen_any(["pY"], ttl_days=30))
+            later = datetime.now(timezone.utc) + timedelta(days=31)
+            self.assertFalse(store.recently_seen_any(["p1"], ttl_days=30, now=later))
 
     def test_prune_expired(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "memory.json"
-            path.write_text(
-                json.dumps(
+            path.write_bytes(
+                orjson.dumps(
                     {
                         "seen": {
                             "old": (datetime.now(timezone.utc) - timedelta(days=40)).isoformat(),
@@ -84,6 +92,25 @@ class SemanticMemoryStoreTests(unittest.TestCase):
             self.assertIn("new", store.state.seen)
             self.assertNotIn("old", store.state.seen)
 
+    def test_prune_expired_skips_entries_remarked_since(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SemanticMemoryStore(str(Path(tmpdir) / "memory.json"), max_ids=10)
+            store.load()
+            old = datetime.now(timezone.utc) - timedelta(days=40)
+            store.mark_seen(["p1", "p2"], at=old)
+            store.mark_seen(["p1"])
+            self.assertEqual(store.prune_expired(ttl_days=30), 1)
+            self.assertEqual(set(store.state.seen), {"p1"})
+            self.assertEqual(store.prune_expired(ttl_days=30), 0)
+
+    def test_seen_arxiv_ids_strips_prefix_and_respects_ttl(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SemanticMemoryStore(str(Path(tmpdir) / "memory.json"), max_ids=10)
+            store.load()
+            store.mark_seen(["arxiv:2501.00001v1", "semantic:CorpusId:1"])
+            store.mark_seen(["arxiv:2401.00002"], at=datetime.now(timezone.utc) - timedelta(days=40))
+            self.assertEqual(store.seen_arxiv_ids(ttl_days=30), {"2501.00001v1"})
+
     def test_invalid_memory_resets_safely(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "memory.json"
@@ -92,6 +119,21 @@ class SemanticMemoryStoreTests(unittest.TestCase):
             store.load()
             self.assertEqual(store.state.seen, {})
 
+    def test_save_skips_clean_state_and_writes_atomically(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "memory.json"
+            store = SemanticMemoryStore(str(path), max_ids=10)
+            store.load()
+            store.mark_seen(["p1"])
+            store.save()
+            written = path.read_text()
+            self.assertFalse(path.with_suffix(".json.tmp").exists())
+
+            store2 = SemanticMemoryStore(str(path), max_ids=10)
+            store2.load()
+            store2.save()
+            self.assertEqual(path.read_text(), written)
+
 
 class SemanticScholarSuppressionTests(unittest.TestCase):
     def test_source_suppression_filters_seen_ids(self):
@@ -136,14 +178,14 @@ class SemanticScholarSuppressionTests(unittest.TestCase):
 
             store2 = SemanticMemoryStore(str(mem_path), max_ids=100)
             store2.load()
-            source = SemanticScholarSource(memory_store=store2, seen_ttl_days=30)
             papers = [
                 Paper("t1", "", "u1", PaperSource.SEMANTIC_SCHOLAR, semantic_paper_id="r1"),
                 Paper("t2", "", "u2", PaperSource.SEMANTIC_SCHOLAR, semantic_paper_id="r2"),
                 Paper("t3", "", "u3", PaperSource.SEMANTIC_SCHOLAR, semantic_paper_id="r3"),
             ]
-            second = source._apply_seen_suppression(papers)
+            second, suppressed = _filter_unseen(store2, 30, papers)
             self.assertEqual([p.semantic_paper_id for p in second], ["r3"])
+            self.assertEqual(suppressed, 2)
 
     def test_cross_source_suppression_uses_arxiv_key(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -174,6 +216,22 @@ class SemanticScholarSuppressionTests(unittest.TestCase):
             filtered = source._apply_seen_suppression(papers)
             self.assertEqual([p.semantic_paper_id for p in filtered], ["s2-b"])
 
+    def test_seed_ids_cached_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            seeds_path = Path(tmpdir) / "seeds.json"
+            seeds_path.write_bytes(orjson.dumps({"positive_paper_ids": [123, "ARXIV:2501.00001"]}))
+            source = SemanticScholarSource(seeds_path=str(seeds_path))
+
+            positive, negative = source._load_seeds()
+            self.assertEqual(positive, ["CorpusId:123", "ARXIV:2501.00001"])
+            self.assertEqual(negative, [])
+            self.assertIs(source._load_seeds()[0], positive)
+
+            seeds_path.write_bytes(orjson.dumps({"positive_paper_ids": [456]}))
+            stat = seeds_path.stat()
+            os.utime(seeds_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual(source._load_seeds()[0], ["CorpusId:456"])
+
 
 class ReportMemoryUpdateTests(unittest.TestCase):
     def test_update_memory_marks_report_visible_cross_source_keys(self):
@@ -227,6 +285,11 @@ class ReportMatchTests(unittest.TestCase):
             _normalize_url_for_match("HTTPS://EXAMPLE.com/path/?x=1#frag"),
             "https://example.com/path",
         )
+        self.assertEqual(
+            _normalize_url_for_match(" https://Example.com/Case/Path//#x "),
+            "https://example.com/Case/Path",
+        )
+        self.assertEqual(_normalize_url_for_match("//example.com/p"), "https://example.com/p")
 
 
 if __name__ == "__main__":